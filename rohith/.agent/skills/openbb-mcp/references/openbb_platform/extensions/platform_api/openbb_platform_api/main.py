@@ -10,7 +10,7 @@ import sys
 from pathlib import Path
 
 import uvicorn
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
 from openbb_core.api.rest_api import app
 from openbb_core.app.service.system_service import SystemService
 from openbb_core.env import Env
@@ -109,6 +109,20 @@ current_settings = get_user_settings(CURRENT_USER_SETTINGS)
 widgets_json = get_widgets_json(
     build, openapi, widget_exclude_filter, EDITABLE, WIDGETS_PATH, app
 )
+# widgets_json is fixed after startup, so its JSON body is rendered once and reused.
+_widgets_json_body: bytes | None = None
+
+
+def widgets_json_response() -> Response:
+    """Serve the startup widgets.json, rendering its JSON body on first use."""
+    global _widgets_json_body  # noqa PLW0603  # pylint: disable=global-statement
+    if _widgets_json_body is None:
+        _widgets_json_body = JSONResponse(content=widgets_json).body
+    return Response(
+        content=_widgets_json_body, media_type="application/json", headers=obb_headers
+    )
+
+
 APPS_PATH = (
     APPS_PATH
     if APPS_PATH
@@ -143,7 +157,7 @@ if not has_root_widgets:
         global FIRST_RUN  # noqa PLW0603  # pylint: disable=global-statement
         if FIRST_RUN is True:
             FIRST_RUN = False
-            return JSONResponse(content=widgets_json, headers=obb_headers)
+            return widgets_json_response()
         if EDITABLE:
             return JSONResponse(
                 content=get_widgets_json(
@@ -151,7 +165,7 @@ if not has_root_widgets:
                 ),
                 headers=obb_headers,
             )
-        return JSONResponse(content=widgets_json, headers=obb_headers)
+        return widgets_json_response()
 
 else:
     # Populate the local name `get_widgets` with the endpoint function of the existing
@@ -165,7 +179,7 @@ else:
         # Fallback mechanism
         async def get_widgets():
             """Return the generated widgets.json"""
-            return JSONResponse(content=widgets_json, headers=obb_headers)
+            return widgets_json_response()
 
 
 # Check if the app has already defined apps.json at the root.
@@ -1,115 +1,107 @@
 """Helper module for merging multiple Fast API endpoints returning widgets.json"""
 
+import asyncio
+from weakref import WeakKeyDictionary
+
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
-from starlette.routing import BaseRoute
+
+# Non-root widgets.json routes per app, stamped with len(app.routes) at scan time.
+_ROUTE_CACHE: WeakKeyDictionary[FastAPI, tuple[int, list[APIRoute]]] = (
+    WeakKeyDictionary()
+)
+
+
+def _widget_routes(app: FastAPI) -> list[APIRoute]:
+    """Return the non-root widgets.json routes, rescanning only if routes changed."""
+    routes = app.routes
+    cached = _ROUTE_CACHE.get(app)
+    if cached is not None and cached[0] == len(routes):
+        return cached[1]
+
+    widget_routes = [
+        route
+        for route in routes
+        if isinstance(route, APIRoute)
+        and route.path != "/widgets.json"
+        and route.path.endswith("widgets.json")
+    ]
+    _ROUTE_CACHE[app] = (len(routes), widget_routes)
+    return widget_routes
 
 
 def has_additional_widgets(app: FastAPI) -> bool:
     """Check for the existence of additional widgets.json endpoints."""
-    for route in app.routes:
-        if not isinstance(route, APIRoute):
-            continue
-        path = getattr(route, "path", "")
-        if path == "/widgets.json":
-            continue
-        if path.endswith("widgets.json"):
-            return True
-    return False
+    return bool(_widget_routes(app))
 
 
 async def get_additional_widgets(app: FastAPI) -> dict:
     """Collect widgets.json from non-root endpoints."""
-    if not has_additional_widgets(app):
-        return {}
+    widget_routes = _widget_routes(app)
 
-    widget_routes: list[BaseRoute] = []
-    for d in app.routes:
-        d_path = getattr(d, "path", "")
-        if d_path not in {"/widgets.json", ""} and d_path.endswith("widgets.json"):
-            widget_routes.append(d)
+    if not widget_routes:
+        return {}
 
+    widget_routes = [r for r in widget_routes if r.endpoint]
+    # Await the endpoints together so handlers doing I/O overlap.
+    results = await asyncio.gather(*(r.endpoint() for r in widget_routes))
     path_widgets: dict = {}
 
-    for r in widget_routes:
-        if (
-            not getattr(r, "endpoint", None)
-            or getattr(r, "path", "") == "/widgets.json"
-        ):
-            continue
-
-        widgets = await r.endpoint()  # type: ignore
-
+    for r, widgets in zip(widget_routes, results):
         if not isinstance(widgets, dict):
             continue
 
-        path = getattr(r, "path", "")
-        path_widgets[path.replace("widgets.json", "")] = dict(widgets.items())
+        path_widgets[r.path.replace("widgets.json", "")] = dict(widgets.items())
 
     return path_widgets
 
 
+def _prefix_path(path: str, value: str) -> str:
+    """Join a root-relative endpoint onto the router path."""
+    return path + value[1:] if value.startswith("/") else value
+
+
+def _prefix_keys(
+    path: str, item: dict, keys: tuple, skip_absolute: bool = True
+) -> dict:
+    """Return the prefixed values for the relative endpoints found under keys."""
+    updates: dict = {}
+    for key in keys:
+        if (
+            (value := item.get(key, ""))
+            and not (skip_absolute and "://" in value)
+            and not value.startswith(path)
+        ):
+            updates[key] = _prefix_path(path, value)
+    return updates
+
+
 def fix_router_widgets(path, widgets):
-    """Append the API prefix and path to the function, if necessary."""
+    """Append the API prefix and path to the function, if necessary.
+
+    Widgets and params that need no prefixing are shared with the source, the rest
+    are shallow copies, so the source is never mutated.
+    """
     updated_widgets: dict = {}
     for widget_id, widget in widgets.items():
         if not isinstance(widget, dict) or widget_id.endswith("/widgets.json"):
             continue
 
-        new_widget: dict = widget.copy()
-        params = widget.get("params", [])
-
-        if (endpoint := widget.get("endpoint", "")) and not endpoint.startswith(path):
-            new_widget["endpoint"] = (
-                path + endpoint[1:] if endpoint.startswith("/") else endpoint
-            )
+        updates = _prefix_keys(path, widget, ("endpoint",), skip_absolute=False)
+        updates.update(_prefix_keys(path, widget, ("wsEndpoint", "imgUrl")))
 
-        if (
-            (ws_endpoint := widget.get("wsEndpoint", ""))
-            and "://" not in ws_endpoint
-            and not ws_endpoint.startswith(path)
-        ):
-            new_widget["wsEndpoint"] = (
-                path + ws_endpoint[1:] if ws_endpoint.startswith("/") else ws_endpoint
-            )
+        params = widget.get("params", [])
+        new_params: list = []
+        for param in params:
+            param_updates = _prefix_keys(path, param, ("endpoint", "optionsEndpoint"))
+            new_params.append({**param, **param_updates} if param_updates else param)
 
-        if (
-            (img_url := widget.get("imgUrl", ""))
-            and "://" not in img_url
-            and not img_url.startswith(path)
+        if "params" not in widget or any(
+            new is not old for new, old in zip(new_params, params)
         ):
-            new_widget["imgUrl"] = (
-                path + img_url[1:] if img_url.startswith("/") else img_url
-            )
-
-        new_params: list = []
+            updates["params"] = new_params
 
-        for param in params:
-            new_param: dict = param.copy()
-
-            if (
-                (endpoint := param.get("endpoint", ""))
-                and "://" not in endpoint
-                and not endpoint.startswith(path)
-            ):
-                new_param["endpoint"] = (
-                    path + endpoint[1:] if endpoint.startswith("/") else endpoint
-                )
-
-            if (
-                (opt_endpoint := param.get("optionsEndpoint", ""))
-                and "://" not in opt_endpoint
-                and not opt_endpoint.startswith(path)
-            ):
-                new_param["optionsEndpoint"] = (
-                    path + opt_endpoint[1:]
-                    if opt_endpoint.startswith("/")
-                    else opt_endpoint
-                )
-
-            new_params.append(new_param)
-
-        new_widget["params"] = new_params
+        new_widget = {**widget, **updates} if updates else widget
         updated_widgets[new_widget.get("widgetId", new_widget["endpoint"])] = new_widget
 
     return updated_widgets
@@ -3,8 +3,25 @@
 # pylint: disable=C0302,R0912
 # flake8: noqa: PLR0912
 
+import re
+from functools import lru_cache
+from typing import Any
+
 from openbb_core.provider.utils.helpers import to_snake_case
 
+_PROVIDER_MARKER_RE = re.compile(r"\(provider:\s*([^)]+)\)")
+_LEADING_SEMICOLON_RE = re.compile(r"^;\s*")
+_MULTIPLE_ITEMS_SUFFIX = "Multiple comma separated items allowed"
+
+# Resolved widget schemas for the most recently seen spec only, keyed by (kind, ...).
+# Seeing a different spec drops them, so at most one spec is kept alive here.
+_SCHEMA_CACHE: dict[str, Any] = {"spec": None, "entries": {}}
+# Label/value option lists built from spec enum lists, keyed by id() of the list.
+# Each value keeps its list so a recycled id() never matches; the oldest entries are
+# evicted past the size cap, and all of them are dropped along with the schema cache.
+_ENUM_OPTIONS_CACHE: dict[tuple[int, bool], tuple[list, list[dict]]] = {}
+_ENUM_OPTIONS_CACHE_SIZE = 1024
+
 TO_CAPS_STRINGS = [
     "Pe",
     "Peg",
@@ -129,6 +146,30 @@ def set_parameter_type(p: dict, p_schema: dict):
     return p
 
 
+def _enum_options(values: list, skip_null: bool = False) -> list[dict]:
+    """Build the label/value options for an enum list from the spec.
+
+    The result is shared by every parameter that reuses the same list object,
+    so it must not be mutated.
+    """
+    if not values:
+        return []
+
+    cache_key = (id(values), skip_null)
+    if (cached := _ENUM_OPTIONS_CACHE.get(cache_key)) and cached[0] is values:
+        return cached[1]
+
+    options = [
+        {"label": str(c), "value": c}
+        for c in values
+        if not skip_null or c not in ["null", None]
+    ]
+    if len(_ENUM_OPTIONS_CACHE) >= _ENUM_OPTIONS_CACHE_SIZE:
+        del _ENUM_OPTIONS_CACHE[next(iter(_ENUM_OPTIONS_CACHE))]
+    _ENUM_OPTIONS_CACHE[cache_key] = (values, options)
+    return options
+
+
 def set_parameter_options(  # noqa: PLR0912  # pylint: disable=too-many-branches
     p: dict, p_schema: dict, providers: list[str]
 ) -> dict:
@@ -160,6 +201,7 @@ def set_parameter_options(  # noqa: PLR0912  # pylint: disable=too-many-branches
     available_providers: set = set()
     unique_general_choices: list = []
     provider: str = ""
+    enum_claimed = False
 
     # Extract provider from title if present
     title_providers = []
@@ -189,13 +231,12 @@ def set_parameter_options(  # noqa: PLR0912  # pylint: disable=too-many-branches
                 if widget_def := p_schema[provider].get("x-widget_config"):
                     widget_configs[provider] = widget_def
             elif len(providers) == 1 and "enum" in p_schema:
+                # Claim the enum for this provider without mutating the spec.
                 provider_choices = p_schema["enum"]
-                p_schema.pop("enum")
+                enum_claimed = True
 
             if provider_choices:
-                choices[provider] = [
-                    {"label": str(c), "value": c} for c in provider_choices
-                ]
+                choices[provider] = _enum_options(provider_choices)
             if provider in p_schema and p_schema[provider].get(
                 "multiple_items_allowed", False
             ):
@@ -216,11 +257,9 @@ def set_parameter_options(  # noqa: PLR0912  # pylint: disable=too-many-branches
                     enum_index = min(i, len(p_schema["anyOf"]) - 1)
                     if "enum" in p_schema["anyOf"][enum_index]:
                         provider_choices = p_schema["anyOf"][enum_index]["enum"]
-                        choices[provider] = [
-                            {"label": str(c), "value": c}
-                            for c in provider_choices
-                            if c not in ["null", None]
-                        ]
+                        choices[provider] = _enum_options(
+                            provider_choices, skip_null=True
+                        )
         else:
             # Existing code for single provider or multiple providers with one enum
             all_provider_choices = []
@@ -248,23 +287,13 @@ def set_parameter_options(  # noqa: PLR0912  # pylint: disable=too-many-branches
 
     # Handle general choices
     general_choices: list = []
-    if "enum" in p_schema:
-        general_choices.extend(
-            [
-                {"label": str(c), "value": c}
-                for c in p_schema["enum"]
-                if c not in ["null", None]
-            ]
-        )
+    if "enum" in p_schema and not enum_claimed:
+        general_choices.extend(_enum_options(p_schema["enum"], skip_null=True))
     elif "anyOf" in p_schema and not title_providers:
         for sub_schema in p_schema["anyOf"]:
             if "enum" in sub_schema:
                 general_choices.extend(
-                    [
-                        {"label": str(c), "value": c}
-                        for c in sub_schema["enum"]
-                        if c not in ["null", None]
-                    ]
+                    _enum_options(sub_schema["enum"], skip_null=True)
                 )
 
     if general_choices:
@@ -290,11 +319,7 @@ def set_parameter_options(  # noqa: PLR0912  # pylint: disable=too-many-branches
         if provider not in choices:
             if "anyOf" in p_schema and p_schema["anyOf"]:
                 fallback_choices = p_schema["anyOf"][0].get("enum", [])
-                choices[provider] = [
-                    {"label": str(c), "value": c}
-                    for c in fallback_choices
-                    if c not in ["null", None]
-                ]
+                choices[provider] = _enum_options(fallback_choices, skip_null=True)
             else:
                 choices[provider] = unique_general_choices
 
@@ -325,46 +350,50 @@ def set_parameter_options(  # noqa: PLR0912  # pylint: disable=too-many-branches
     return p
 
 
+def _schema_cache_for(openapi_json: dict) -> dict[tuple, Any]:
+    """Get the widget schema cache for this spec, dropping any other spec's entries."""
+    if _SCHEMA_CACHE["spec"] is not openapi_json:
+        _SCHEMA_CACHE["spec"] = openapi_json
+        _SCHEMA_CACHE["entries"] = {}
+        # Enum lists belong to the previous spec as well
+        _ENUM_OPTIONS_CACHE.clear()
+    return _SCHEMA_CACHE["entries"]
+
+
+def clear_openapi_caches() -> None:
+    """Clear the cached widget schemas and provider descriptions."""
+    _SCHEMA_CACHE["spec"] = None
+    _SCHEMA_CACHE["entries"] = {}
+    _ENUM_OPTIONS_CACHE.clear()
+    _extract_provider_description.cache_clear()
+
+
+@lru_cache(maxsize=4096)
 def _extract_provider_description(full_description: str, provider: str) -> str:
     r"""Extract description for a specific provider from merged description.
 
     Description format: "desc1 (provider: prov1);\n    desc2 (provider: prov2)"
     """
-    # pylint: disable=import-outside-toplevel
-    import re
-
     if not full_description:
         return ""
 
-    # Check if this is a multi-provider description
-    if "(provider:" not in full_description:
-        return full_description.split("Multiple comma separated items allowed")[
-            0
-        ].strip()
-
-    # Handle semicolons embedded in the description text
-    parts = re.split(r"(\(provider:\s*[^)]+\))", full_description)
-
-    # Find the text that comes before the provider marker we want
-    for i, part in enumerate(parts):
-        is_matching_provider = (
-            f"provider: {provider})" in part
-            or f"provider: {provider}," in part
-            or f", {provider})" in part
-        )
-        if is_matching_provider and i > 0:
-            # The description is the part before this marker
-            desc = parts[i - 1].strip()
+    first_desc = None
+    start = 0
+    # Each marker closes the description text that precedes it.
+    for marker in _PROVIDER_MARKER_RE.finditer(full_description):
+        desc = full_description[start : marker.start()]
+        if first_desc is None:
+            first_desc = desc
+        if provider in (name.strip() for name in marker.group(1).split(",")):
             # Remove leading semicolons and whitespace from continuation sections
-            desc = re.sub(r"^;\s*", "", desc).strip()
-            # Remove "Multiple comma separated items allowed" suffix
-            desc = desc.split("Multiple comma separated items allowed")[0].strip()
-            return desc
+            desc = _LEADING_SEMICOLON_RE.sub("", desc.strip())
+            return desc.partition(_MULTIPLE_ITEMS_SUFFIX)[0].strip()
+        start = marker.end()
 
-    # If no specific provider section found, return first section (general description)
-    first_desc = full_description.split("(provider:")[0].strip()
-    first_desc = first_desc.split("Multiple comma separated items allowed")[0].strip()
-    return first_desc
+    # No markers at all, or no section for this provider: use the general description.
+    if first_desc is None:
+        first_desc = full_description
+    return first_desc.partition(_MULTIPLE_ITEMS_SUFFIX)[0].strip()
 
 
 def process_parameter(
@@ -487,6 +516,9 @@ def process_parameter(
         []
     )  # Start with empty list - only add providers that match
 
+    # Lowercased once for the membership checks below
+    providers_lower = {prov.lower() for prov in providers}
+
     # Extract providers from title
     if p_schema.get("title"):
         # Handle comma-separated list of providers in the title
@@ -494,7 +526,7 @@ def process_parameter(
             title_providers = [p.strip().lower() for p in p_schema["title"].split(",")]
             available_providers_list.extend(title_providers)
             provider_specific = True
-        elif p_schema["title"].lower() in [p.lower() for p in providers]:
+        elif p_schema["title"].lower() in providers_lower:
             # Single provider in title
             available_providers_list.append(p_schema["title"].lower())
             provider_specific = True
@@ -535,19 +567,14 @@ def process_parameter(
     if provider_specific and available_providers_list:
         # ONLY include providers that are actually in the provided providers list
         valid_provider_list = [
-            p
-            for p in available_providers_list
-            if p.lower() in [prov.lower() for prov in providers]
+            p for p in available_providers_list if p.lower() in providers_lower
         ]
 
         if valid_provider_list:
             p["available_providers"] = valid_provider_list
             # Check if any of our current providers match the validated available providers list
-            valid_for_current_providers = any(
-                current_provider.lower()
-                in [valid_p.lower() for valid_p in valid_provider_list]
-                for current_provider in providers
-            )
+            valid_lower = {valid_p.lower() for valid_p in valid_provider_list}
+            valid_for_current_providers = not providers_lower.isdisjoint(valid_lower)
 
             # If parameter is provider-specific but not valid for any of our current providers, skip it
             if not valid_for_current_providers:
@@ -575,7 +602,13 @@ def get_query_schema_for_widget(
     -------
     Tuple[List[Dict], bool]
         A tuple containing the list of processed parameters and a boolean indicating if a chart is present.
+        The result is cached per spec and must not be mutated by the caller.
     """
+    cache = _schema_cache_for(openapi_json)
+    cache_key = ("query", command_route, single_provider)
+    if cache_key in cache:
+        return cache[cache_key]
+
     has_chart = False
     command = openapi_json["paths"][command_route]
     command = command.get("get", {})
@@ -600,7 +633,9 @@ def get_query_schema_for_widget(
         if not p.get("exclude") and not p.get("x-widget_config", {}).get("exclude"):
             route_params.append(p)
 
-    return route_params, has_chart
+    result = (route_params, has_chart)
+    cache[cache_key] = result
+    return result
 
 
 def get_data_schema_for_widget(openapi_json, operation_id, route: str | None = None):
@@ -614,6 +649,18 @@ def get_data_schema_for_widget(openapi_json, operation_id, route: str | None = N
     Returns:
         dict: The schema dictionary for the widget's data.
     """
+    cache = _schema_cache_for(openapi_json)
+    cache_key = ("data", operation_id, route)
+    if cache_key in cache:
+        return cache[cache_key]
+
+    schema = _find_data_schema_for_widget(openapi_json, operation_id, route)
+    cache[cache_key] = schema
+    return schema
+
+
+def _find_data_schema_for_widget(openapi_json, operation_id, route: str | None = None):
+    """Look up the response data schema for the operationId or route in the spec."""
     # Find the route and method for the given operationId
 
     if not route:
@@ -662,15 +709,11 @@ def get_data_schema_for_widget(openapi_json, operation_id, route: str | None = N
     return None
 
 
-# pylint: disable=too-many-branches,too-many-statements
-def data_schema_to_columns_defs(  # noqa: PLR0912
-    openapi_json,
-    operation_id,
-    provider,
-    route: str | None = None,
-    get_widget_config: bool = False,
-):
-    """Convert data schema to column definitions for the widget."""
+# pylint: disable=too-many-branches
+def _get_target_data_schema(  # noqa: PLR0912
+    openapi_json, operation_id, provider, route: str | None = None
+) -> dict:
+    """Resolve the response model schema used to build a widget for the provider."""
     schema_refs: list = []
     result_schema_ref = get_data_schema_for_widget(openapi_json, operation_id, route)
 
@@ -711,7 +754,7 @@ def data_schema_to_columns_defs(  # noqa: PLR0912
 
     # Proceed with finding common keys and generating column definitions
     if not schemas:
-        return []
+        return {}
 
     target_schema: dict = {}
 
@@ -743,9 +786,14 @@ def data_schema_to_columns_defs(  # noqa: PLR0912
         if not target_schema and schemas:
             target_schema = schemas[0]
 
-    if get_widget_config:
-        return target_schema.get("x-widget_config", {})
+    return target_schema
 
+
+# pylint: disable=too-many-branches,too-many-statements
+def _target_schema_to_columns_defs(  # noqa: PLR0912
+    target_schema: dict, route: str | None = None
+) -> list:
+    """Build the column definitions from a resolved response model schema."""
     keys = list(target_schema.get("properties", {}))
     column_defs: list = []
 
@@ -952,6 +1000,65 @@ def data_schema_to_columns_defs(  # noqa: PLR0912
     return column_defs
 
 
+def data_schema_to_columns_defs(
+    openapi_json,
+    operation_id,
+    provider,
+    route: str | None = None,
+    get_widget_config: bool = False,
+):
+    """Convert data schema to column definitions for the widget."""
+    target_schema = _get_target_data_schema(openapi_json, operation_id, provider, route)
+
+    if not target_schema:
+        return []
+
+    if get_widget_config:
+        return target_schema.get("x-widget_config", {})
+
+    return _target_schema_to_columns_defs(target_schema, route)
+
+
+def data_schema_to_columns_defs_and_config(
+    openapi_json,
+    operation_id,
+    provider,
+    route: str | None = None,
+    get_columns_defs: bool = True,
+) -> tuple[list, dict]:
+    """
+    Get the column definitions and the data widget config from a single schema lookup.
+
+    Parameters
+    ----------
+    openapi_json : dict
+        The OpenAPI specification as a dictionary.
+    operation_id : str
+        The operationId of the widget.
+    provider : str
+        The provider to select the response model for.
+    route : str | None
+        The route of the command in the OpenAPI specification.
+    get_columns_defs : bool
+        Whether to build the column definitions. Defaults to True.
+
+    Returns
+    -------
+    tuple[list, dict]
+        The column definitions and the 'x-widget_config' of the response model.
+    """
+    target_schema = _get_target_data_schema(openapi_json, operation_id, provider, route)
+
+    if not target_schema:
+        return [], {}
+
+    columns_defs = (
+        _target_schema_to_columns_defs(target_schema, route) if get_columns_defs else []
+    )
+
+    return columns_defs, target_schema.get("x-widget_config", {})
+
+
 def post_query_schema_for_widget(
     openapi_json,
     operation_id,
@@ -238,7 +238,7 @@ def build_json(  # noqa: PLR0912  # pylint: disable=too-many-branches, too-many-
     from openbb_core.app.service.system_service import SystemService  # noqa
     from .openapi import (
         TO_CAPS_STRINGS,
-        data_schema_to_columns_defs,
+        data_schema_to_columns_defs_and_config,
         extract_providers,
         get_query_schema_for_widget,
         post_query_schema_for_widget,
@@ -345,11 +345,13 @@ def build_json(  # noqa: PLR0912  # pylint: disable=too-many-branches, too-many-
                     or []
                 )
 
-            columns_defs = (
-                data_schema_to_columns_defs(openapi, widget_id, provider, route)
-                if widget_config_dict.get("type")
-                not in ["multi_file_viewer", "pdf", "metric"]
-                else []
+            columns_defs, data_config = data_schema_to_columns_defs_and_config(
+                openapi,
+                widget_id,
+                provider,
+                route,
+                get_columns_defs=widget_config_dict.get("type")
+                not in ["multi_file_viewer", "pdf", "metric"],
             )
             _cats = [
                 r
@@ -634,16 +636,14 @@ def build_json(  # noqa: PLR0912  # pylint: disable=too-many-branches, too-many-
 
             data_var_key: dict = {}
 
-            if data_config := data_schema_to_columns_defs(
-                openapi, widget_id, provider, route, True
-            ):
-                for key, value in data_config.copy().items():  # type: ignore
+            if data_config:
+                for key, value in data_config.copy().items():
                     if key.startswith("$."):
                         data_var_key[key] = value
 
                 widget_config["data"] = deep_merge_configs(
                     widget_config["data"],
-                    {k: v for k, v in data_config.items() if not k.startswith("$.")},  # type: ignore
+                    {k: v for k, v in data_config.items() if not k.startswith("$.")},
                 )
 
             if data_var_key:
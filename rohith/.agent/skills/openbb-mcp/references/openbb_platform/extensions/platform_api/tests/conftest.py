@@ -0,0 +1,139 @@
+"""Pytest configuration for the OpenBB Platform API tests."""
+
+import functools
+import importlib
+import json
+import re
+import sys
+import types
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+_SNAKE_RE1 = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_SNAKE_RE2 = re.compile(r"([a-z0-9])([A-Z])")
+_SNAKE_RE3 = re.compile(r"[\s\-]+")
+
+
+class DummySystemService:
+    """Stand-in SystemService exposing only the settings the API module reads."""
+
+    def __init__(self, *_args, **_kwargs):
+        """Build the minimal system settings namespace."""
+        self.system_settings = types.SimpleNamespace(
+            python_settings=types.SimpleNamespace(model_dump=lambda: {"uvicorn": {}}),
+            cors=types.SimpleNamespace(
+                allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
+            ),
+            api_settings=types.SimpleNamespace(prefix="/api"),
+        )
+
+
+_DUMMY_SS = DummySystemService()
+
+
+@functools.cache
+def _load_main_with_mocks():
+    # pylint: disable=import-outside-toplevel
+    # Imported from its defining module so a patched fastapi.FastAPI never leaks in.
+    from fastapi.applications import FastAPI
+
+    stub_app = FastAPI()
+    core_module = types.ModuleType("openbb_core")
+    core_module.__path__ = []
+    api_module = types.ModuleType("openbb_core.api")
+    api_module.__path__ = []
+    rest_api_module = types.ModuleType("openbb_core.api.rest_api")
+    rest_api_module.app = stub_app  # type: ignore
+    app_module = types.ModuleType("openbb_core.app")
+    app_module.__path__ = []
+    app_service_module = types.ModuleType("openbb_core.app.service")
+    app_service_module.__path__ = []
+    system_service_module = types.ModuleType("openbb_core.app.service.system_service")
+    system_service_module.SystemService = lambda *_a, **_kw: _DUMMY_SS  # type:ignore
+    env_module = types.ModuleType("openbb_core.env")
+    env_module.Env = lambda: None  # type: ignore
+
+    provider_module = types.ModuleType("openbb_core.provider")
+    provider_module.__path__ = []
+    provider_utils_module = types.ModuleType("openbb_core.provider.utils")
+    provider_utils_module.__path__ = []
+    provider_utils_helpers_module = types.ModuleType(
+        "openbb_core.provider.utils.helpers"
+    )
+
+    def _run_async_stub(callable_or_coroutine, *args, **kwargs):
+        import asyncio
+
+        result = (
+            callable_or_coroutine(*args, **kwargs)
+            if callable(callable_or_coroutine)
+            else callable_or_coroutine
+        )
+
+        if hasattr(result, "__await__"):
+            try:
+                loop = asyncio.get_event_loop()
+            except RuntimeError:
+                loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(loop)
+            if loop.is_running():
+                return asyncio.ensure_future(result)  # type: ignore
+            return loop.run_until_complete(result)  # type: ignore
+        return result
+
+    def _to_snake_case_stub(value: str) -> str:
+        if not value:
+            return value
+        value = _SNAKE_RE1.sub(r"\1_\2", value)
+        value = _SNAKE_RE2.sub(r"\1_\2", value)
+        return _SNAKE_RE3.sub("_", value).lower()
+
+    provider_utils_helpers_module.run_async = _run_async_stub  # type: ignore
+    provider_utils_helpers_module.to_snake_case = _to_snake_case_stub  # type: ignore
+
+    modules = {
+        "openbb_core": core_module,
+        "openbb_core.api": api_module,
+        "openbb_core.api.rest_api": rest_api_module,
+        "openbb_core.app": app_module,
+        "openbb_core.app.service": app_service_module,
+        "openbb_core.app.service.system_service": system_service_module,
+        "openbb_core.env": env_module,
+        "openbb_core.provider": provider_module,
+        "openbb_core.provider.utils": provider_utils_module,
+        "openbb_core.provider.utils.helpers": provider_utils_helpers_module,
+    }
+
+    with patch.dict(sys.modules, modules):
+        sys.modules.pop("openbb_platform_api.main", None)
+        return importlib.import_module("openbb_platform_api.main")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def mock_env_vars(tmp_path_factory):
+    """Point HOME and USERPROFILE at a temporary directory for the whole test session."""
+    with pytest.MonkeyPatch.context() as m:
+        mock_home = tmp_path_factory.mktemp("home")
+        m.setenv("HOME", str(mock_home))
+        m.setenv("USERPROFILE", str(mock_home))
+        yield
+
+
+@pytest.fixture(scope="session")
+def openbb_main_module(tmp_path_factory):
+    """Import openbb_platform_api.main against stubbed core modules, once per session."""
+    with pytest.MonkeyPatch.context() as mp:
+        mock_home = tmp_path_factory.mktemp("main_home")
+        mp.setenv("HOME", str(mock_home))
+        mp.setenv("USERPROFILE", str(mock_home))
+        return _load_main_with_mocks()
+
+
+@pytest.fixture(scope="session")
+def mock_openapi_json():
+    """Parse the mock OpenAPI spec once for every test module that uses it."""
+    mock_openapi_path = Path(__file__).parent / "mock_openapi.json"
+    with open(mock_openapi_path, encoding="utf-8") as file:
+        return json.load(file)
@@ -1,13 +1,17 @@
 """Test the API utilities module."""
 
-import importlib
+import io
 import json
 import sys
 import types
-from unittest.mock import AsyncMock, MagicMock, mock_open, patch
+from contextlib import ExitStack
+from itertools import chain, repeat
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
 
 import openbb_platform_api.utils.api as api_utils
 import pytest
+from fastapi import FastAPI as RealFastAPI
 from openbb_platform_api.utils.api import (
     check_port,
     get_user_settings,
@@ -16,107 +20,69 @@ from openbb_platform_api.utils.api import (
     parse_args,
 )
 
+# Mock modules to prevent real imports of the OpenBB core when loading an app
+_SHARED_REST_API = MagicMock()
+_SHARED_REST_API.system = MagicMock()
+_SHARED_MODULE_PATCHES = {
+    "openbb_core.api.rest_api": _SHARED_REST_API,
+    "openbb_core.api.router.commands": MagicMock(),
+    "openbb_core.app.command_runner": MagicMock(),
+    "openbb_core.app.static.package_builder": MagicMock(),
+    "openbb_core.app.provider_interface": MagicMock(),
+    "openbb_core.provider.registry": MagicMock(),
+    "openbb_core.app.extension_loader": MagicMock(),
+}
+
+# Dotted targets of the OpenBB core services replaced while loading an app
+_PATCH_TARGETS = {
+    "system": "openbb_core.app.service.system_service.SystemService",
+    "user_read": "openbb_core.app.service.user_service.UserService.read_from_file",
+    "credentials_load": "openbb_core.app.model.credentials.CredentialsLoader.load",
+    "add_routers": "openbb_core.api.app_loader.AppLoader.add_routers",
+}
+
+# Shared return values for the stubbed loaders and endpoints
+_CREDENTIALS_SENTINEL = MagicMock()
+_WIDGETS_RESPONSE = {"default": {}, "from-default": {}, "extra": {}}
+_ADDITIONAL_APPS_RESPONSE = {"good": [{"id": "extra"}], "bad": {"id": "invalid"}}
+
+# Windows-only tests are left out at collection time on other platforms
+_IS_WINDOWS = sys.platform == "win32"
+
+_CORS_NS = types.SimpleNamespace(
+    allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
+)
+
+
+class _SSFactory:
+    """Stand-in for SystemService returning plain settings namespaces."""
 
-# Mock environment variables
-@pytest.fixture(autouse=True)
-def mock_env_vars(monkeypatch, tmp_path_factory):
-    mock_home = tmp_path_factory.mktemp("home")
-    monkeypatch.setenv("HOME", str(mock_home))
-    monkeypatch.setenv("USERPROFILE", str(mock_home))
-
-
-def _load_main_with_mocks():
-    # pylint: disable=import-outside-toplevel
-    from fastapi import FastAPI
-
-    stub_app = FastAPI()
-    core_module = types.ModuleType("openbb_core")
-    core_module.__path__ = []
-    api_module = types.ModuleType("openbb_core.api")
-    api_module.__path__ = []
-    rest_api_module = types.ModuleType("openbb_core.api.rest_api")
-    rest_api_module.app = stub_app  # type: ignore
-    app_module = types.ModuleType("openbb_core.app")
-    app_module.__path__ = []
-    app_service_module = types.ModuleType("openbb_core.app.service")
-    app_service_module.__path__ = []
-    system_service_module = types.ModuleType("openbb_core.app.service.system_service")
-
-    class DummySystemService:
-        def __init__(self, *_args, **_kwargs):
-            self.system_settings = types.SimpleNamespace(
+    def __call__(self, *_args, **_kwargs):
+        return types.SimpleNamespace(
+            system_settings=types.SimpleNamespace(
+                cors=_CORS_NS,
+                api_settings=types.SimpleNamespace(prefix="/api"),
                 python_settings=types.SimpleNamespace(
                     model_dump=lambda: {"uvicorn": {}}
                 ),
-                cors=types.SimpleNamespace(
-                    allow_origins=["*"], allow_methods=["*"], allow_headers=["*"]
-                ),
-                api_settings=types.SimpleNamespace(prefix="/api"),
             )
-
-    system_service_module.SystemService = DummySystemService  # type:ignore
-    env_module = types.ModuleType("openbb_core.env")
-    env_module.Env = lambda: None  # type: ignore
-
-    provider_module = types.ModuleType("openbb_core.provider")
-    provider_module.__path__ = []
-    provider_utils_module = types.ModuleType("openbb_core.provider.utils")
-    provider_utils_module.__path__ = []
-    provider_utils_helpers_module = types.ModuleType(
-        "openbb_core.provider.utils.helpers"
-    )
-
-    def _run_async_stub(callable_or_coroutine, *args, **kwargs):
-        import asyncio
-
-        result = (
-            callable_or_coroutine(*args, **kwargs)
-            if callable(callable_or_coroutine)
-            else callable_or_coroutine
         )
 
-        if hasattr(result, "__await__"):
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            if loop.is_running():
-                return asyncio.ensure_future(result)  # type: ignore
-            return loop.run_until_complete(result)  # type: ignore
-        return result
-
-    def _to_snake_case_stub(value: str) -> str:
-        import re
-
-        if not value:
-            return value
-        value = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", value)
-        value = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", value)
-        return re.sub(r"[\s\-]+", "_", value).lower()
-
-    provider_utils_helpers_module.run_async = _run_async_stub  # type: ignore
-    provider_utils_helpers_module.to_snake_case = _to_snake_case_stub  # type: ignore
-
-    modules = {
-        "openbb_core": core_module,
-        "openbb_core.api": api_module,
-        "openbb_core.api.rest_api": rest_api_module,
-        "openbb_core.app": app_module,
-        "openbb_core.app.service": app_service_module,
-        "openbb_core.app.service.system_service": system_service_module,
-        "openbb_core.env": env_module,
-        "openbb_core.provider": provider_module,
-        "openbb_core.provider.utils": provider_utils_module,
-        "openbb_core.provider.utils.helpers": provider_utils_helpers_module,
-    }
 
-    for name in list(modules):
-        sys.modules.pop(name, None)
-
-    with patch.dict(sys.modules, modules):
-        sys.modules.pop("openbb_platform_api.main", None)
-        return importlib.import_module("openbb_platform_api.main")
+def _enter_core_patches(stack: ExitStack) -> None:
+    """Replace the core services from _PATCH_TARGETS, one patch.multiple per owner."""
+    replacements = {
+        "system": _SSFactory(),
+        "user_read": lambda *_args, **_kwargs: None,
+        "credentials_load": lambda *_args, **_kwargs: _CREDENTIALS_SENTINEL,
+        "add_routers": lambda *_args, **_kwargs: None,
+    }
+    by_owner: dict = {}
+    for key, new in replacements.items():
+        owner, attribute = _PATCH_TARGETS[key].rsplit(".", 1)
+        by_owner.setdefault(owner, {})[attribute] = new
+    for owner, attributes in by_owner.items():
+        stack.enter_context(patch.multiple(owner, **attributes))
 
 
 @pytest.mark.parametrize("port_input", [6900, "6900", 6901, "6901"])
@@ -134,208 +100,156 @@ def test_check_port(port_input):
         assert port == 6901  # The next available port should be 6901
 
 
-def test_get_user_settings_no_login():
-    with patch(
-        "builtins.open",
-        mock_open(
-            read_data='{"credentials": {}, "preferences": {}, "defaults": {"commands": {}}}'
-        ),
-    ):
-        settings = get_user_settings(current_user_settings="")
-        assert settings == {
-            "credentials": {},
-            "preferences": {},
-            "defaults": {"commands": {}},
-        }
-
-
-def test_get_widgets_json_no_build():
-    dummy_main = types.ModuleType("openbb_platform_api.main")
-    dummy_main.FIRST_RUN = False  # type: ignore
-
-    with (
-        patch("builtins.open", mock_open(read_data="{}")),
-        patch("os.path.exists", return_value=True),
-        patch(
-            "openbb_platform_api.utils.widgets.build_json", MagicMock(return_value={})
-        ),
-        patch.dict(
-            sys.modules,
-            {"uvicorn": MagicMock(), "openbb_platform_api.main": dummy_main},
-        ),
-    ):
-        widgets_json = get_widgets_json(
-            _build=False, _openapi={}, widget_exclude_filter=[]
-        )
-        assert widgets_json == {}
+@pytest.fixture(scope="session")
+def user_settings_file(tmp_path_factory):
+    settings_file = tmp_path_factory.mktemp("cfg") / "user_settings.json"
+    settings_file.write_text(
+        '{"credentials": {}, "preferences": {}, "defaults": {"commands": {}}}'
+    )
+    return settings_file
 
 
-def test_parse_args():
-    with patch("sys.argv", ["script.py", "--help"]):
-        with pytest.raises(SystemExit) as e:
-            parse_args()
-        assert e.type is SystemExit
-        assert e.value.code == 0
+@pytest.fixture(scope="session")
+def widgets_json_file(tmp_path_factory):
+    widgets_file = tmp_path_factory.mktemp("assets") / "widgets.json"
+    widgets_file.write_text("{}")
+    return widgets_file
 
-    with patch("sys.argv", ["script.py", "--key", "value"]):
-        args = parse_args()
-        assert args == {"key": "value"}
 
-    with patch("sys.argv", ["script.py", "--flag"]):
-        args = parse_args()
-        assert args == {"flag": True}
+def test_get_user_settings_no_login(user_settings_file):
+    settings = get_user_settings(current_user_settings=str(user_settings_file))
+    assert settings == {
+        "credentials": {},
+        "preferences": {},
+        "defaults": {"commands": {}},
+    }
 
 
-def test_import_module_app():
-    # pylint: disable=import-outside-toplevel
-    from fastapi import FastAPI as RealFastAPI
+def test_get_widgets_json_no_build(monkeypatch, widgets_json_file):
+    mock_build_json = MagicMock(return_value={})
+    monkeypatch.setattr(api_utils, "FIRST_RUN", False)
+    monkeypatch.setattr("openbb_platform_api.utils.widgets.build_json", mock_build_json)
 
-    class MockFastAPI(RealFastAPI):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.add_middleware = MagicMock()
+    widgets_json = get_widgets_json(
+        _build=False,
+        _openapi={},
+        widget_exclude_filter=[],
+        editable=True,
+        widgets_path=str(widgets_json_file),
+    )
+    assert widgets_json == {}
+    mock_build_json.assert_not_called()
 
-    # Create mock modules to prevent real imports
-    mock_rest_api = MagicMock()
-    mock_rest_api.system = MagicMock()
 
-    with (
-        patch.dict(
-            "sys.modules",
-            {
-                "openbb_core.api.rest_api": mock_rest_api,
-                "openbb_core.api.router.commands": MagicMock(),
-                "openbb_core.app.command_runner": MagicMock(),
-                "openbb_core.app.static.package_builder": MagicMock(),
-                "openbb_core.app.provider_interface": MagicMock(),
-                "openbb_core.provider.registry": MagicMock(),
-                "openbb_core.app.extension_loader": MagicMock(),
-            },
-        ),
-        patch("importlib.import_module") as mock_import,
-        patch("fastapi.FastAPI", new=MockFastAPI),
-        patch("openbb_core.app.service.system_service.SystemService") as mock_system,
-        patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-        patch("openbb_core.app.model.credentials.CredentialsLoader.load"),
-        patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-    ):
-        # Mock system settings
-        mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-        mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-        mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-        # Rest of test setup...
-        mock_module = MagicMock()
-        mock_module.__spec__ = MagicMock()
-        mock_module.app = MockFastAPI()
-        mock_import.return_value = mock_module
+@pytest.mark.parametrize(
+    "argv, expected_exit, expected",
+    [
+        (["script.py", "--help"], 0, None),
+        (["script.py", "--key", "value"], None, {"key": "value"}),
+        (["script.py", "--flag"], None, {"flag": True}),
+    ],
+)
+def test_parse_args(monkeypatch, argv, expected_exit, expected):
+    monkeypatch.setattr(sys, "argv", argv)
 
-        result = import_app("my_module:app", "app", False)
-        assert isinstance(result, MockFastAPI)
+    if expected_exit is not None:
+        with pytest.raises(SystemExit) as e:
+            parse_args()
+        assert e.type is SystemExit
+        assert e.value.code == expected_exit
+    else:
+        assert parse_args() == expected
 
 
-def test_import_file_app(tmp_path):
-    # pylint: disable=import-outside-toplevel
-    from fastapi import FastAPI as RealFastAPI
+@pytest.fixture(scope="module")
+def import_app_env():
+    """Patch the OpenBB core dependencies of import_app once for the module."""
 
     class MockFastAPI(RealFastAPI):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
+        # Subclassed only to pass import_app's isinstance check; skipping
+        # FastAPI.__init__ avoids building the router and OpenAPI scaffolding.
+        def __init__(self, *_args, **_kwargs):  # pylint: disable=super-init-not-called
             self.add_middleware = MagicMock()
+            self.exception_handlers = {}
 
-    mock_rest_api = MagicMock()
-    mock_rest_api.system = MagicMock()
-    app_file = tmp_path / "integration_app.py"
-    app_file.write_text("from fastapi import FastAPI\n\napp = FastAPI()\n")
-    module_name = app_file.stem
+    with ExitStack() as stack:
+        stack.enter_context(patch.dict("sys.modules", _SHARED_MODULE_PATCHES))
+        stack.enter_context(patch("fastapi.FastAPI", new=MockFastAPI))
+        _enter_core_patches(stack)
 
-    with (
-        patch.dict(
-            "sys.modules",
-            {
-                "openbb_core.api.rest_api": mock_rest_api,
-                "openbb_core.api.router.commands": MagicMock(),
-                "openbb_core.app.command_runner": MagicMock(),
-                "openbb_core.app.static.package_builder": MagicMock(),
-                "openbb_core.app.provider_interface": MagicMock(),
-                "openbb_core.provider.registry": MagicMock(),
-                "openbb_core.app.extension_loader": MagicMock(),
-            },
-        ),
-        patch("fastapi.FastAPI", new=MockFastAPI),
-        patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-        patch(
-            "openbb_core.app.model.credentials.CredentialsLoader.load",
-            return_value=MagicMock(),
-        ),
-        patch("openbb_core.app.service.system_service.SystemService") as mock_system,
-        patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-    ):
-        mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-        mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-        mock_system.return_value.system_settings.cors.allow_headers = ["*"]
+        yield types.SimpleNamespace(MockFastAPI=MockFastAPI)
 
-        result = import_app(str(app_file), "app", False)
-        loaded_module = sys.modules.get(module_name)
 
-        assert isinstance(result, MockFastAPI)
-        assert loaded_module is not None
-        assert getattr(loaded_module, "app", None) is result
+@pytest.fixture(scope="session")
+def integration_app_file(tmp_path_factory):
+    app_file = tmp_path_factory.mktemp("iapp") / "integration_app.py"
+    app_file.write_text("from fastapi import FastAPI\n\napp = FastAPI()\n")
+    yield app_file
+    sys.modules.pop(app_file.stem, None)
 
-    sys.modules.pop(module_name, None)
 
+@pytest.fixture
+def import_app_case(request, monkeypatch, import_app_env, integration_app_file):
+    """Layer the case-specific modules for test_import_app on the shared environment."""
+    MockFastAPI = import_app_env.MockFastAPI
 
-def test_import_factory_app():
-    # pylint: disable=import-outside-toplevel
-    from fastapi import FastAPI as RealFastAPI
+    if request.param == "file":
+        module_name = integration_app_file.stem
 
-    class MockFastAPI(RealFastAPI):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.add_middleware = MagicMock()
+        def check_file(result):
+            loaded_module = sys.modules.get(module_name)
+            assert loaded_module is not None
+            assert getattr(loaded_module, "app", None) is result
 
-    # Create mock modules to prevent real imports
-    mock_rest_api = MagicMock()
-    mock_rest_api.system = MagicMock()
+        yield types.SimpleNamespace(
+            args=(str(integration_app_file), "app", False), check=check_file
+        )
+        return
 
-    with (
-        patch.dict(
-            "sys.modules",
-            {
-                "openbb_core.api.rest_api": mock_rest_api,
-                "openbb_core.api.router.commands": MagicMock(),
-                "openbb_core.app.command_runner": MagicMock(),
-                "openbb_core.app.static.package_builder": MagicMock(),
-                "openbb_core.app.provider_interface": MagicMock(),
-                "openbb_core.provider.registry": MagicMock(),
-                "openbb_core.app.extension_loader": MagicMock(),
-            },
-        ),
-        patch("importlib.import_module") as mock_import,
-        patch("fastapi.FastAPI", new=MockFastAPI),
-        patch("openbb_core.app.service.system_service.SystemService") as mock_system,
-        patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-        patch(
-            "openbb_core.app.model.credentials.CredentialsLoader.load",
-            return_value=MagicMock(),
-        ),
-        patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-    ):
-        # Configure system settings mock
-        mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-        mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-        mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-        # Create a proper mock module with __spec__ attribute
-        mock_module = MagicMock()
-        mock_module.__spec__ = MagicMock()
+    # Create a proper mock module with __spec__ attribute
+    mock_module = MagicMock()
+    mock_module.__spec__ = MagicMock()
+
+    if request.param == "factory":
         factory = MagicMock(return_value=MockFastAPI())
         mock_module.factory_func = factory
-        mock_import.return_value = mock_module
+        monkeypatch.setitem(sys.modules, "main", mock_module)
+        yield types.SimpleNamespace(
+            args=("main:factory_func", "factory_func", True),
+            check=lambda _: factory.assert_called_once(),
+        )
+    else:
+        mock_module.app = MockFastAPI()
+        monkeypatch.setitem(sys.modules, "my_module", mock_module)
+        yield types.SimpleNamespace(
+            args=("my_module:app", "app", False), check=lambda _: None
+        )
 
-        result = import_app("main:factory_func", "factory_func", True)
-        factory.assert_called_once()
-        assert isinstance(result, MockFastAPI)
+
+@pytest.mark.parametrize(
+    "import_app_case", ["module", "file", "factory"], indirect=True
+)
+def test_import_app(import_app_case, import_app_env):
+    result = import_app(*import_app_case.args)
+    assert isinstance(result, import_app_env.MockFastAPI)
+    import_app_case.check(result)
+
+
+@pytest.mark.benchmark(group="import_app")
+def test_import_app_perf(benchmark, monkeypatch, import_app_env):
+    mock_module = MagicMock()
+    mock_module.__spec__ = MagicMock()
+    mock_module.app = import_app_env.MockFastAPI()
+    monkeypatch.setitem(sys.modules, "my_module", mock_module)
+
+    result = benchmark.pedantic(
+        import_app,
+        args=("my_module:app", "app", False),
+        rounds=10,
+        iterations=1,
+        warmup_rounds=1,
+    )
+    assert isinstance(result, import_app_env.MockFastAPI)
 
 
 # =============================================================================
@@ -346,176 +260,90 @@ def test_import_factory_app():
 class TestPathHandling:
     """Test cross-platform path handling in import_app function."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_fastapi_env(self):
         """Set up common mocks for FastAPI import tests."""
-        # pylint: disable=import-outside-toplevel
-        from fastapi import FastAPI as RealFastAPI
 
         class MockFastAPI(RealFastAPI):
-            def __init__(self, *args, **kwargs):
-                super().__init__(*args, **kwargs)
+            # Subclassed only to pass import_app's isinstance check; skipping
+            # FastAPI.__init__ avoids building the router and OpenAPI scaffolding.
+            def __init__(self, *_args, **_kwargs):  # pylint: disable=super-init-not-called
                 self.add_middleware = MagicMock()
+                self.exception_handlers = {}
+
+        return MockFastAPI
+
+    @pytest.fixture(scope="class")
+    def patched_env(self, mock_fastapi_env):
+        """Enter the OpenBB core patches once for the whole class."""
+        MockFastAPI = mock_fastapi_env
 
-        mock_rest_api = MagicMock()
-        mock_rest_api.system = MagicMock()
+        with ExitStack() as stack:
+            stack.enter_context(patch.dict("sys.modules", _SHARED_MODULE_PATCHES))
+            stack.enter_context(patch("fastapi.FastAPI", new=MockFastAPI))
+            _enter_core_patches(stack)
 
-        return MockFastAPI, mock_rest_api
+            yield MockFastAPI
+
+    @pytest.fixture(scope="class")
+    def shared_app_file(self, tmp_path_factory):
+        """Write the default app file once for the cases that don't need their own."""
+        app_file = tmp_path_factory.mktemp("apps") / "test_app.py"
+        app_file.write_text("from fastapi import FastAPI\n\napp = FastAPI()\n")
+        return app_file
 
     def _create_app_file(self, tmp_path, filename="test_app.py"):
         """Create a test app file."""
         app_file = tmp_path / filename
+        app_file.parent.mkdir(parents=True, exist_ok=True)
         app_file.write_text("from fastapi import FastAPI\n\napp = FastAPI()\n")
         return app_file
 
-    def test_unix_absolute_path(self, tmp_path, mock_fastapi_env):
-        """Test Unix-style absolute paths (e.g., /home/user/app.py)."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
-        app_file = self._create_app_file(tmp_path)
-
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            # Test with absolute Unix-style path
-            result = import_app(str(app_file), "app", False)
-            assert isinstance(result, MockFastAPI)
-
-    def test_relative_path(self, tmp_path, mock_fastapi_env, monkeypatch):
-        """Test relative paths are resolved correctly."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
-        app_file = self._create_app_file(tmp_path)
-        monkeypatch.chdir(tmp_path)
-
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
+    @pytest.mark.parametrize(
+        "filename, path_factory",
+        [
+            pytest.param(None, str, id="unix_absolute"),
+            pytest.param(None, lambda f: f.name, id="relative"),
+            pytest.param(
+                "subdir/myapp.py", lambda _: "subdir/myapp.py", id="subdirectory"
             ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            # Test with relative path
-            result = import_app(app_file.name, "app", False)
-            assert isinstance(result, MockFastAPI)
-
-    def test_relative_path_with_subdirectory(
-        self, tmp_path, mock_fastapi_env, monkeypatch
+            pytest.param("custom_app.py", lambda f: f"{f}:app", id="colon_notation"),
+        ]
+        + (
+            [
+                pytest.param(None, str, id="windows_absolute"),
+                pytest.param(None, lambda f: f"{f}:app", id="windows_colon_notation"),
+            ]
+            if _IS_WINDOWS
+            else []
+        ),
+    )
+    def test_import_paths(
+        self,
+        tmp_path,
+        patched_env,
+        shared_app_file,
+        monkeypatch,
+        filename,
+        path_factory,
     ):
-        """Test relative paths with subdirectories."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
-        subdir = tmp_path / "subdir"
-        subdir.mkdir()
-        app_file = subdir / "myapp.py"
-        app_file.write_text("from fastapi import FastAPI\n\napp = FastAPI()\n")
-        monkeypatch.chdir(tmp_path)
-
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            # Test with relative path including subdirectory
-            result = import_app("subdir/myapp.py", "app", False)
-            assert isinstance(result, MockFastAPI)
+        """Test absolute, relative and colon-notation file paths resolve the app."""
+        MockFastAPI = patched_env
+        if filename is None:
+            app_file = shared_app_file
+            monkeypatch.chdir(shared_app_file.parent)
+        else:
+            app_file = self._create_app_file(tmp_path, filename)
+            monkeypatch.chdir(tmp_path)
+
+        result = import_app(path_factory(app_file), "app", False)
+        assert isinstance(result, MockFastAPI)
 
-    def test_module_colon_notation(self, mock_fastapi_env):
+    def test_module_colon_notation(self, patched_env):
         """Test module:name colon notation (e.g., 'my_module:app')."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
-
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("importlib.import_module") as mock_import,
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch("openbb_core.app.model.credentials.CredentialsLoader.load"),
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
+        MockFastAPI = patched_env
 
+        with patch("importlib.import_module") as mock_import:
             mock_module = MagicMock()
             mock_module.__spec__ = MagicMock()
             mock_module.myapp = MockFastAPI()
@@ -526,191 +354,24 @@ class TestPathHandling:
             # Verify the target module was imported (among other imports)
             mock_import.assert_any_call("some_package.module")
 
-    def test_file_path_with_colon_notation(self, tmp_path, mock_fastapi_env):
-        """Test file path with colon notation (e.g., 'myfile.py:app')."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
-        app_file = self._create_app_file(tmp_path, "custom_app.py")
-
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            # Test with file path + colon notation
-            result = import_app(f"{app_file}:app", "app", False)
-            assert isinstance(result, MockFastAPI)
-
-    def test_file_not_found_error(self, tmp_path, mock_fastapi_env):
+    def test_file_not_found_error(self, tmp_path, monkeypatch):
         """Test FileNotFoundError is raised for non-existent files."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
+        # Only import_app's own rest_api import needs stubbing; it raises before
+        # the app is loaded, so the full class-level patch set is not required.
+        monkeypatch.setitem(sys.modules, "openbb_core.api.rest_api", _SHARED_REST_API)
         non_existent_path = tmp_path / "does_not_exist.py"
 
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            with pytest.raises(FileNotFoundError):
-                import_app(str(non_existent_path), "app", False)
-
-    def test_attribute_error_missing_app_instance(self, tmp_path, mock_fastapi_env):
+        with pytest.raises(FileNotFoundError):
+            import_app(str(non_existent_path), "app", False)
+
+    def test_attribute_error_missing_app_instance(self, tmp_path, monkeypatch):
         """Test AttributeError is raised when app instance is missing."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
+        monkeypatch.setitem(sys.modules, "openbb_core.api.rest_api", _SHARED_REST_API)
         app_file = tmp_path / "no_app.py"
         app_file.write_text("# No app defined here\nx = 1\n")
 
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            with pytest.raises(AttributeError):
-                import_app(str(app_file), "app", False)
-
-    @pytest.mark.skipif(sys.platform != "win32", reason="Windows-specific test")
-    def test_windows_absolute_path(self, tmp_path, mock_fastapi_env):
-        """Test Windows-style absolute paths (e.g., C:\\Users\\app.py)."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
-        app_file = self._create_app_file(tmp_path)
-
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            # On Windows, tmp_path will have a drive letter (e.g., C:\...)
-            result = import_app(str(app_file), "app", False)
-            assert isinstance(result, MockFastAPI)
-
-    @pytest.mark.skipif(sys.platform != "win32", reason="Windows-specific test")
-    def test_windows_path_with_colon_notation(self, tmp_path, mock_fastapi_env):
-        """Test Windows path with colon notation (e.g., C:\\path\\app.py:myapp)."""
-        MockFastAPI, mock_rest_api = mock_fastapi_env
-        app_file = self._create_app_file(tmp_path)
-
-        with (
-            patch.dict(
-                "sys.modules",
-                {
-                    "openbb_core.api.rest_api": mock_rest_api,
-                    "openbb_core.api.router.commands": MagicMock(),
-                    "openbb_core.app.command_runner": MagicMock(),
-                    "openbb_core.app.static.package_builder": MagicMock(),
-                    "openbb_core.app.provider_interface": MagicMock(),
-                    "openbb_core.provider.registry": MagicMock(),
-                    "openbb_core.app.extension_loader": MagicMock(),
-                },
-            ),
-            patch("fastapi.FastAPI", new=MockFastAPI),
-            patch("openbb_core.app.service.user_service.UserService.read_from_file"),
-            patch(
-                "openbb_core.app.model.credentials.CredentialsLoader.load",
-                return_value=MagicMock(),
-            ),
-            patch(
-                "openbb_core.app.service.system_service.SystemService"
-            ) as mock_system,
-            patch("openbb_core.api.app_loader.AppLoader.add_routers"),
-        ):
-            mock_system.return_value.system_settings.cors.allow_origins = ["*"]
-            mock_system.return_value.system_settings.cors.allow_methods = ["*"]
-            mock_system.return_value.system_settings.cors.allow_headers = ["*"]
-
-            # Windows path with colon notation: C:\path\app.py:app
-            result = import_app(f"{app_file}:app", "app", False)
-            assert isinstance(result, MockFastAPI)
+        with pytest.raises(AttributeError):
+            import_app(str(app_file), "app", False)
 
 
 class TestPathDetectionHelpers:
@@ -718,8 +379,6 @@ class TestPathDetectionHelpers:
 
     def test_is_absolute_path_detection_unix(self):
         """Test absolute path detection for Unix paths."""
-        from pathlib import Path
-
         # Unix absolute paths
         assert Path("/home/user/app.py").is_absolute() is True
         assert Path("/app.py").is_absolute() is True
@@ -728,78 +387,98 @@ class TestPathDetectionHelpers:
         assert Path("./app.py").is_absolute() is False
         assert Path("subdir/app.py").is_absolute() is False
 
-    @pytest.mark.skipif(sys.platform != "win32", reason="Windows-specific test")
-    def test_is_absolute_path_detection_windows(self):
-        """Test absolute path detection for Windows paths."""
-        from pathlib import Path
-
-        # Windows absolute paths
-        assert Path("C:\\Users\\app.py").is_absolute() is True
-        assert Path("D:/Projects/app.py").is_absolute() is True
-        # Relative paths
-        assert Path("app.py").is_absolute() is False
-        assert Path(".\\app.py").is_absolute() is False
-
-    def test_colon_notation_vs_windows_drive(self):
+    @pytest.mark.parametrize(
+        "notation", ["module:app", "package.module:app", "my_app.main:create_app"]
+    )
+    def test_colon_notation_vs_windows_drive(self, notation):
         """Test distinguishing module:name notation from Windows drive letters."""
-        # These should be recognized as module:name notation
-        module_notations = [
-            "module:app",
-            "package.module:app",
-            "my_app.main:create_app",
-        ]
-
-        for notation in module_notations:
-            # Has colon and is not a Windows drive letter pattern
-            assert ":" in notation
-            # First char before colon is not a single letter (drive)
-            parts = notation.split(":")
-            assert len(parts[0]) > 1 or not parts[0].isalpha()
-
-    @pytest.mark.skipif(sys.platform != "win32", reason="Windows-specific test")
-    def test_windows_drive_letter_detection(self):
-        """Test detection of Windows drive letters vs colon notation."""
-        from pathlib import Path
-
-        # Windows paths with drive letters
-        windows_paths = [
-            "C:\\app.py",
-            "D:/Projects/app.py",
-            "E:\\Users\\test\\app.py",
-        ]
-
-        for path_str in windows_paths:
+        # Has colon and is not a Windows drive letter pattern
+        assert ":" in notation
+        # First char before colon is not a single letter (drive)
+        module_part = notation.split(":")[0]
+        assert len(module_part) > 1 or not module_part.isalpha()
+
+    if _IS_WINDOWS:
+
+        def test_is_absolute_path_detection_windows(self):
+            """Test absolute path detection for Windows paths."""
+            # Windows absolute paths
+            assert Path("C:\\Users\\app.py").is_absolute() is True
+            assert Path("D:/Projects/app.py").is_absolute() is True
+            # Relative paths
+            assert Path("app.py").is_absolute() is False
+            assert Path(".\\app.py").is_absolute() is False
+
+        @pytest.mark.parametrize(
+            "path_str", ["C:\\app.py", "D:/Projects/app.py", "E:\\Users\\test\\app.py"]
+        )
+        def test_windows_drive_letter_detection(self, path_str):
+            """Test detection of Windows drive letters vs colon notation."""
             path = Path(path_str)
             # Should be detected as absolute (has drive)
             assert path.is_absolute()
             # Drive should be detected
             assert path.drive != ""
 
-        # Windows path WITH colon notation (e.g., C:\path\app.py:myapp)
-        complex_path = "C:\\Projects\\app.py:myapp"
-        # This has multiple colons - drive colon + notation colon
-        assert complex_path.count(":") == 2
+        def test_windows_path_with_colon_notation_colons(self):
+            """Test a Windows path with colon notation."""
+            complex_path = "C:\\Projects\\app.py:myapp"
+            # This has multiple colons - drive colon + notation colon
+            assert complex_path.count(":") == 2
+
+
+class _FakeOpen:
+    """Stand-in for ``open`` serving in-memory payloads in call order."""
+
+    def __init__(self, *payloads):
+        self._payloads = iter(payloads)
+        self.calls: list = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append(call(*args, **kwargs))
+        return io.StringIO(next(self._payloads))
+
+    @property
+    def call_count(self) -> int:
+        return len(self.calls)
+
+    def assert_any_call(self, *args, **kwargs):
+        assert call(*args, **kwargs) in self.calls
+
+
+async def _no_widgets_stub(*_args, **_kwargs):
+    return {}
+
+
+async def _widgets_stub(*_args, **_kwargs):
+    return _WIDGETS_RESPONSE
+
+
+async def _additional_apps_stub(*_args, **_kwargs):
+    return _ADDITIONAL_APPS_RESPONSE
 
 
 @pytest.mark.asyncio
-async def test_get_apps_json_creates_missing_file(tmp_path):
-    main = _load_main_with_mocks()
+@pytest.mark.xdist_group("openbb_main")
+async def test_get_apps_json_creates_missing_file(tmp_path, openbb_main_module):
+    main = openbb_main_module
     apps_path = tmp_path / "workspace_apps.json"
     default_path = tmp_path / "default_apps.json"
-    exists_sequence = [False, False, False, True]
+    exists_results = chain((False, False, False, True), repeat(True))
+    mocked_open = _FakeOpen("", "[]")
 
     def exists_side_effect(_):
-        return exists_sequence.pop(0) if exists_sequence else True
+        return next(exists_results)
 
     with (
         patch.object(main, "APPS_PATH", str(apps_path)),
         patch.object(main, "DEFAULT_APPS_PATH", str(default_path)),
-        patch.object(main, "get_widgets", AsyncMock(return_value={})),
+        patch.object(main, "get_widgets", _no_widgets_stub),
         patch(
             "openbb_platform_api.main.os.path.exists", side_effect=exists_side_effect
         ),
         patch("openbb_platform_api.main.os.makedirs") as mock_makedirs,
-        patch("builtins.open", mock_open(read_data="[]")) as mocked_open,
+        patch("builtins.open", mocked_open),
     ):
         response = await main.get_apps_json()
 
@@ -809,8 +488,11 @@ async def test_get_apps_json_creates_missing_file(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_get_apps_json_merges_templates_with_additional_sources(tmp_path):
-    main = _load_main_with_mocks()
+@pytest.mark.xdist_group("openbb_main")
+async def test_get_apps_json_merges_templates_with_additional_sources(
+    tmp_path, openbb_main_module
+):
+    main = openbb_main_module
     apps_path = tmp_path / "workspace_apps.json"
     default_path = tmp_path / "default_apps.json"
     default_templates_data = json.dumps(
@@ -821,10 +503,7 @@ async def test_get_apps_json_merges_templates_with_additional_sources(tmp_path):
         ]
     )
     apps_templates_data = json.dumps({"id": "default"})
-    default_handle = mock_open(read_data=default_templates_data).return_value
-    apps_handle = mock_open(read_data=apps_templates_data).return_value
-    mocked_open = mock_open()
-    mocked_open.side_effect = [default_handle, apps_handle]
+    mocked_open = _FakeOpen(default_templates_data, apps_templates_data)
 
     with (
         patch.object(main, "APPS_PATH", str(apps_path)),
@@ -844,14 +523,12 @@ async def test_get_apps_json_merges_templates_with_additional_sources(tmp_path):
         patch.object(
             main,
             "get_widgets",
-            AsyncMock(return_value={"default": {}, "from-default": {}, "extra": {}}),
+            _widgets_stub,
         ),
         patch.object(
             main,
             "get_additional_apps",
-            AsyncMock(
-                return_value={"good": [{"id": "extra"}], "bad": {"id": "invalid"}}
-            ),
+            _additional_apps_stub,
         ),
         patch("openbb_platform_api.main.has_additional_apps", return_value=True),
         patch("openbb_platform_api.main.logger.error") as mock_log_error,
@@ -875,6 +552,24 @@ async def test_get_apps_json_merges_templates_with_additional_sources(tmp_path):
         assert {"id": "extra"} in result
 
 
+@pytest.mark.xdist_group("openbb_main")
+def test_widgets_json_response_renders_body_once(openbb_main_module):
+    main = openbb_main_module
+    widgets = {"widget-1": {"name": "Widget 1"}}
+
+    with (
+        patch.object(main, "widgets_json", widgets),
+        patch.object(main, "_widgets_json_body", None),
+    ):
+        first = main.widgets_json_response()
+        second = main.widgets_json_response()
+
+    assert json.loads(first.body) == widgets
+    assert second.body is first.body
+    assert first.media_type == "application/json"
+    assert first.headers["X-Backend-Type"] == "OpenBB Platform"
+
+
 def test_get_widgets_json_merges_with_additional_sources(monkeypatch):
     base_widgets = {"default": {"name": "Default Widget"}}
     additional_widgets = {"extra": {"name": "Extra Widget"}}
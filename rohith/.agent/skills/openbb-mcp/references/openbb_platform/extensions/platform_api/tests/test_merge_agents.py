@@ -26,30 +26,40 @@ def _build_app(include_extra: bool = False, extra_returns_dict: bool = True) ->
     return app
 
 
-def test_has_additional_agents_false_without_extra_routes():
-    app = _build_app(include_extra=False)
-    assert not has_additional_agents(app)
+@pytest.fixture(scope="module")
+def app_no_extra() -> FastAPI:
+    return _build_app(include_extra=False)
 
 
-def test_has_additional_agents_true_with_extra_routes():
-    app = _build_app(include_extra=True)
-    assert has_additional_agents(app)
+@pytest.fixture(scope="module")
+def app_with_dict_extra() -> FastAPI:
+    return _build_app(include_extra=True)
+
+
+@pytest.fixture(scope="module")
+def app_with_invalid_extra() -> FastAPI:
+    return _build_app(include_extra=True, extra_returns_dict=False)
+
+
+def test_has_additional_agents_false_without_extra_routes(app_no_extra):
+    assert not has_additional_agents(app_no_extra)
+
+
+def test_has_additional_agents_true_with_extra_routes(app_with_dict_extra):
+    assert has_additional_agents(app_with_dict_extra)
 
 
 @pytest.mark.asyncio
-async def test_get_additional_agents_returns_empty_when_none():
-    app = _build_app(include_extra=False)
-    assert await get_additional_agents(app) == {}
+async def test_get_additional_agents_returns_empty_when_none(app_no_extra):
+    assert await get_additional_agents(app_no_extra) == {}
 
 
 @pytest.mark.asyncio
-async def test_get_additional_agents_collects_valid_routes():
-    app = _build_app(include_extra=True)
-    additional = await get_additional_agents(app)
+async def test_get_additional_agents_collects_valid_routes(app_with_dict_extra):
+    additional = await get_additional_agents(app_with_dict_extra)
     assert additional == {"/module/": {"module": {"id": "module-agent"}}}
 
 
 @pytest.mark.asyncio
-async def test_get_additional_agents_skips_non_dict_responses():
-    app = _build_app(include_extra=True, extra_returns_dict=False)
-    assert await get_additional_agents(app) == {}
+async def test_get_additional_agents_skips_non_dict_responses(app_with_invalid_extra):
+    assert await get_additional_agents(app_with_invalid_extra) == {}
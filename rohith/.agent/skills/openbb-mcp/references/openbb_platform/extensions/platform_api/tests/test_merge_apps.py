@@ -26,30 +26,40 @@ def _build_app(include_extra: bool = False, extra_returns_list: bool = True) ->
     return app
 
 
-def test_has_additional_apps_false_without_extra_routes():
-    app = _build_app(include_extra=False)
-    assert not has_additional_apps(app)
+@pytest.fixture(scope="module")
+def app_no_extra() -> FastAPI:
+    return _build_app(include_extra=False)
 
 
-def test_has_additional_apps_true_with_extra_routes():
-    app = _build_app(include_extra=True)
-    assert has_additional_apps(app)
+@pytest.fixture(scope="module")
+def app_with_list_extra() -> FastAPI:
+    return _build_app(include_extra=True)
+
+
+@pytest.fixture(scope="module")
+def app_with_invalid_extra() -> FastAPI:
+    return _build_app(include_extra=True, extra_returns_list=False)
+
+
+def test_has_additional_apps_false_without_extra_routes(app_no_extra):
+    assert not has_additional_apps(app_no_extra)
+
+
+def test_has_additional_apps_true_with_extra_routes(app_with_list_extra):
+    assert has_additional_apps(app_with_list_extra)
 
 
 @pytest.mark.asyncio
-async def test_get_additional_apps_returns_empty_when_none():
-    app = _build_app(include_extra=False)
-    assert await get_additional_apps(app) == {}
+async def test_get_additional_apps_returns_empty_when_none(app_no_extra):
+    assert await get_additional_apps(app_no_extra) == {}
 
 
 @pytest.mark.asyncio
-async def test_get_additional_apps_skips_non_list_responses():
-    app = _build_app(include_extra=True, extra_returns_list=False)
-    assert await get_additional_apps(app) == {}
+async def test_get_additional_apps_skips_non_list_responses(app_with_invalid_extra):
+    assert await get_additional_apps(app_with_invalid_extra) == {}
 
 
 @pytest.mark.asyncio
-async def test_get_additional_apps_collects_valid_routes():
-    app = _build_app(include_extra=True)
-    apps = await get_additional_apps(app)
+async def test_get_additional_apps_collects_valid_routes(app_with_list_extra):
+    apps = await get_additional_apps(app_with_list_extra)
     assert apps == {"/module/": [{"appId": "module", "endpoint": "/module/data"}]}
@@ -1,5 +1,6 @@
 """Test merge_widgets module."""
 
+import asyncio
 import copy
 
 import pytest
@@ -46,6 +47,17 @@ def test_has_additional_widgets_true_with_extra_routes():
     assert has_additional_widgets(app)
 
 
+def test_has_additional_widgets_rescans_after_routes_change():
+    app = _build_app(include_extra=False)
+    assert not has_additional_widgets(app)
+
+    @app.get("/late/widgets.json")
+    async def late_widgets():
+        return {}
+
+    assert has_additional_widgets(app)
+
+
 @pytest.mark.asyncio
 async def test_get_additional_widgets_returns_empty_when_none():
     app = _build_app(include_extra=False)
@@ -73,6 +85,29 @@ async def test_get_additional_widgets_collects_valid_routes():
     }
 
 
+@pytest.mark.asyncio
+async def test_get_additional_widgets_awaits_routes_concurrently():
+    app = FastAPI()
+    events: list = []
+
+    def _make_handler(name):
+        async def handler():
+            events.append(f"start:{name}")
+            await asyncio.sleep(0)
+            events.append(f"end:{name}")
+            return {name: {"widgetId": name, "endpoint": f"/{name}/data"}}
+
+        return handler
+
+    for name in ("one", "two"):
+        app.add_api_route(f"/{name}/widgets.json", _make_handler(name))
+
+    widgets = await get_additional_widgets(app)
+
+    assert set(widgets) == {"/one/", "/two/"}
+    assert events[:2] == ["start:one", "start:two"]
+
+
 def test_fix_router_widgets_updates_nested_paths_without_mutating_source():
     original = {
         "widgetA": {
@@ -104,6 +139,21 @@ def test_fix_router_widgets_updates_nested_paths_without_mutating_source():
     assert widget["params"][0]["endpoint"] == "/api/param"
     assert widget["params"][0]["optionsEndpoint"] == "/api/param/options"
     assert widget["params"][1]["endpoint"] == "http://external/api"
+    # Params that need no prefix are passed through without copying
+    assert widget["params"][1] is original["widgetA"]["params"][1]
+
+
+def test_fix_router_widgets_shares_widgets_that_need_no_prefix():
+    original = {
+        "ready": {
+            "widgetId": "ready",
+            "endpoint": "/api/ready",
+            "params": [{"name": "p", "optionsEndpoint": "https://external/opts"}],
+        }
+    }
+    updated = fix_router_widgets("/api/", original)
+
+    assert updated["ready"] is original["ready"]
 
 
 @pytest.mark.asyncio
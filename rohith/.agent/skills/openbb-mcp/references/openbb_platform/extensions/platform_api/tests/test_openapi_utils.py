@@ -3,13 +3,19 @@
 # pylint: disable=redefined-outer-name,line-too-long
 # flake8: noqa: E501
 
+import gc
 import json
-from pathlib import Path
+import weakref
 
 import pytest
 from openbb_platform_api.utils.openapi import (
+    _ENUM_OPTIONS_CACHE,
+    _ENUM_OPTIONS_CACHE_SIZE,
+    _enum_options,
     _extract_provider_description,
+    clear_openapi_caches,
     data_schema_to_columns_defs,
+    data_schema_to_columns_defs_and_config,
     get_data_schema_for_widget,
     get_query_schema_for_widget,
     post_query_schema_for_widget,
@@ -17,14 +23,6 @@ from openbb_platform_api.utils.openapi import (
 )
 
 
-# Load the mock OpenAPI JSON
-@pytest.fixture(scope="module")
-def mock_openapi_json():
-    mock_openapi_path = Path(__file__).parent / "mock_openapi.json"
-    with open(mock_openapi_path, encoding="utf-8") as file:
-        return json.load(file)
-
-
 @pytest.mark.parametrize(
     "path, params_number, query_schema, expected_has_chart",
     [
@@ -381,6 +379,101 @@ def test_data_schema_to_columns_defs(mock_openapi_json, openapi_operation_id):
     assert len(column_defs) > 1  # There should be at least two columns
 
 
+@pytest.mark.parametrize(
+    "openapi_operation_id",
+    [
+        "economy_survey_sloos",
+        "economy_survey_university_of_michigan",
+        "economy_balance_of_payments",
+    ],
+)
+def test_data_schema_to_columns_defs_and_config(
+    mock_openapi_json, openapi_operation_id
+):
+    """Test data_schema_to_columns_defs_and_config matches the separate calls."""
+    column_defs, data_config = data_schema_to_columns_defs_and_config(
+        mock_openapi_json, openapi_operation_id, provider="fred"
+    )
+    assert column_defs == data_schema_to_columns_defs(
+        mock_openapi_json, openapi_operation_id, provider="fred"
+    )
+    assert data_config == data_schema_to_columns_defs(
+        mock_openapi_json, openapi_operation_id, "fred", None, True
+    )
+
+    no_columns, _ = data_schema_to_columns_defs_and_config(
+        mock_openapi_json, openapi_operation_id, "fred", get_columns_defs=False
+    )
+    assert no_columns == []
+
+
+def test_widget_schemas_are_cached_per_spec(mock_openapi_json):
+    clear_openapi_caches()
+    path = "/api/v1/economy/fred_series"
+    openapi_operation_id = "economy_survey_sloos"
+    query_schema = get_query_schema_for_widget(mock_openapi_json, path)
+    data_schema = get_data_schema_for_widget(mock_openapi_json, openapi_operation_id)
+
+    assert get_query_schema_for_widget(mock_openapi_json, path) is query_schema
+    assert (
+        get_data_schema_for_widget(mock_openapi_json, openapi_operation_id)
+        is data_schema
+    )
+
+    # An equal but distinct spec is resolved on its own
+    spec_copy = json.loads(json.dumps(mock_openapi_json))
+    assert get_query_schema_for_widget(spec_copy, path) is not query_schema
+    assert get_query_schema_for_widget(spec_copy, path) == query_schema
+
+    clear_openapi_caches()
+    assert get_query_schema_for_widget(mock_openapi_json, path) is not query_schema
+
+
+def test_widget_schema_cache_does_not_pin_old_specs(mock_openapi_json):
+    clear_openapi_caches()
+    path = "/api/v1/economy/fred_series"
+
+    class Spec(dict):
+        """Weak-referenceable spec dict."""
+
+    old_spec = Spec(json.loads(json.dumps(mock_openapi_json)))
+    get_query_schema_for_widget(old_spec, path)
+    get_data_schema_for_widget(old_spec, "economy_survey_sloos")
+    old_ref = weakref.ref(old_spec)
+
+    get_query_schema_for_widget(mock_openapi_json, path)
+    del old_spec
+    gc.collect()
+
+    assert old_ref() is None
+
+
+def test_enum_options_shared_per_enum_list():
+    clear_openapi_caches()
+    enum = ["a", None, "b"]
+    options = _enum_options(enum, skip_null=True)
+
+    assert options == [{"label": "a", "value": "a"}, {"label": "b", "value": "b"}]
+    assert _enum_options(enum, skip_null=True) is options
+    assert _enum_options(list(enum), skip_null=True) is not options
+    assert len(_enum_options(enum)) == 3
+
+
+def test_enum_options_cache_is_bounded():
+    clear_openapi_caches()
+    enums = [[str(i)] for i in range(_ENUM_OPTIONS_CACHE_SIZE + 10)]
+    for values in enums:
+        _enum_options(values)
+
+    assert len(_ENUM_OPTIONS_CACHE) == _ENUM_OPTIONS_CACHE_SIZE
+    # The oldest lists were evicted first, the newest is still shared
+    assert _enum_options(enums[-1]) is _enum_options(enums[-1])
+
+    # Switching specs drops the enum lists resolved for the previous one
+    get_query_schema_for_widget({"paths": {"/x": {"get": {}}}}, "/x")
+    assert not _ENUM_OPTIONS_CACHE
+
+
 class TestExtractProviderDescription:
     """Tests for _extract_provider_description function."""
 
@@ -420,6 +513,22 @@ class TestExtractProviderDescription:
         result = _extract_provider_description(desc, "fred")
         assert result == "Description text"
 
+    def test_provider_in_middle_of_marker(self):
+        """Test provider listed between others in comma-separated list."""
+        desc = "General description (provider: other);\n    Shared text (provider: other, fred, yfinance)"
+        result = _extract_provider_description(desc, "fred")
+        assert result == "Shared text"
+
+    def test_repeated_lookups_are_cached(self):
+        """Test that repeated (description, provider) pairs hit the cache."""
+        desc = "Cached description (provider: fred)"
+        _extract_provider_description.cache_clear()
+        first = _extract_provider_description(desc, "fred")
+        second = _extract_provider_description(desc, "fred")
+        info = _extract_provider_description.cache_info()
+        assert first == second == "Cached description"
+        assert (info.hits, info.misses) == (1, 1)
+
     def test_empty_description(self):
         """Test handling of empty description."""
         result = _extract_provider_description("", "fred")
@@ -8,14 +8,6 @@ from openbb_platform_api.utils.widgets import build_json, modify_query_schema
 # pylint: disable=redefined-outer-name
 
 
-# Load the mock OpenAPI JSON
-@pytest.fixture(scope="module")
-def mock_openapi_json():
-    mock_openapi_path = Path(__file__).parent / "mock_openapi.json"
-    with open(mock_openapi_path) as file:
-        return json.load(file)
-
-
 # Load the mock widgets JSON
 @pytest.fixture(scope="module")
 def mock_widgets_json():
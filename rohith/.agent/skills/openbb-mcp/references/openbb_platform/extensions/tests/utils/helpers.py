@@ -7,11 +7,22 @@ import inspect
 import logging
 import os
 import re
-from ast import AsyncFunctionDef, Call, FunctionDef, Name, parse, unparse
+from ast import (
+    AsyncFunctionDef,
+    Call,
+    FunctionDef,
+    Name,
+    get_source_segment,
+    parse,
+    unparse,
+    walk,
+)
 from dataclasses import dataclass
+from functools import cache
 from importlib.metadata import EntryPoint, entry_points
 from inspect import getmembers, isfunction
 from sys import version_info
+from types import MappingProxyType
 from typing import Any
 
 from importlib_metadata import EntryPoints
@@ -164,6 +175,28 @@ def collect_router_functions(loaded_routers: list) -> dict:
     return router_functions
 
 
+@cache
+def _decorators_for_file(file_path: str) -> dict[str, str]:
+    """Map every function in the file to its @router.command decorator source."""
+    with open(file_path) as file:
+        source = file.read()
+
+    decorators: dict[str, str] = {}
+    for node in walk(parse(source)):
+        if not isinstance(node, (FunctionDef, AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            func = decorator.func if isinstance(decorator, Call) else decorator
+            if unparse(func) == "router.command":
+                segment = get_source_segment(source, decorator) or ""
+                # Match the single-line "@router.command(...)" form used by callers
+                decorators[node.name] = "@" + " ".join(
+                    line.strip() for line in segment.splitlines()
+                )
+
+    return decorators
+
+
 def find_decorator(file_path: str, function_name: str) -> str:
     """Find the @router.command decorator of the function in the file, supporting multiline decorators."""
     this_dir = os.path.dirname(os.path.abspath(__file__))
@@ -171,36 +204,7 @@ def find_decorator(file_path: str, function_name: str) -> str:
     base_path = normalized_dir.split("openbb_platform/")[0]
     file_path = os.path.join(base_path, "openbb_platform", file_path)
 
-    with open(file_path) as file:
-        lines = file.readlines()
-
-    decorator_lines = []
-    capturing_decorator = False
-    for line in lines:
-        stripped_line = line.strip()
-        # Start capturing lines if we encounter a decorator
-        if stripped_line.startswith("@router.command"):
-            capturing_decorator = True
-            decorator_lines.append(stripped_line)
-        elif capturing_decorator:
-            # If we're currently capturing a decorator and the line is part of it (indentation or open parenthesis)
-            if (
-                stripped_line.startswith("@")
-                or "def" in stripped_line
-                and function_name in stripped_line
-            ):
-                # If we've reached another decorator or the function definition, stop capturing
-                capturing_decorator = False
-                # If it's the target function, break, else clear decorator_lines for the next decorator
-                if "def" in stripped_line and function_name in stripped_line:
-                    break
-                decorator_lines = []
-            else:
-                # It's part of the multiline decorator
-                decorator_lines.append(stripped_line)
-
-    decorator = " ".join(decorator_lines)
-    return decorator
+    return _decorators_for_file(file_path).get(function_name, "")
 
 
 @dataclass
@@ -212,28 +216,41 @@ class Decorator:
     kwargs: dict | None = None
 
 
+def _get_decorator(func_def: FunctionDef | AsyncFunctionDef) -> Decorator | None:
+    """Extract the last decorator and its arguments from a function definition."""
+    if not func_def.decorator_list:
+        return None
+    args: dict | None = None
+    kwargs: dict | None = None
+    for decorator in func_def.decorator_list:
+        if isinstance(decorator, Call):
+            name = (
+                decorator.func.id
+                if isinstance(decorator.func, Name)
+                else unparse(decorator.func)
+            )
+            args = {i: unparse(arg) for i, arg in enumerate(decorator.args)}
+            kwargs = {kw.arg: unparse(kw.value) for kw in decorator.keywords}
+        else:
+            name = decorator.id if isinstance(decorator, Name) else unparse(decorator)
+    return Decorator(name, args, kwargs)
+
+
+@cache
+def _decorator_details_for_module(module_name: str) -> dict[str, Decorator | None]:
+    """Map every function in the module to its decorator details."""
+    module = importlib.import_module(module_name)
+    details: dict[str, Decorator | None] = {}
+    for node in walk(parse(inspect.getsource(module))):
+        if isinstance(node, (FunctionDef, AsyncFunctionDef)):
+            # Outer definitions come first in the walk and take precedence
+            details.setdefault(node.name, _get_decorator(node))
+    return details
+
+
 def get_decorator_details(function) -> Decorator | None:
     """Extract decorators and their arguments from a function."""
-    source = inspect.getsource(function)
-    parsed_source = parse(source)
-
-    if isinstance(parsed_source.body[0], (FunctionDef, AsyncFunctionDef)):
-        func_def = parsed_source.body[0]
-        for decorator in func_def.decorator_list:
-            if isinstance(decorator, Call):
-                name = (
-                    decorator.func.id
-                    if isinstance(decorator.func, Name)
-                    else unparse(decorator.func)
-                )
-                args = {i: unparse(arg) for i, arg in enumerate(decorator.args)}
-                kwargs = {kw.arg: unparse(kw.value) for kw in decorator.keywords}
-            else:
-                name = (
-                    decorator.id if isinstance(decorator, Name) else unparse(decorator)
-                )
-        return Decorator(name, args, kwargs)
-    return None
+    return _decorator_details_for_module(function.__module__).get(function.__name__)
 
 
 def find_missing_router_function_models(
@@ -242,11 +259,9 @@ def find_missing_router_function_models(
     """Find the missing models in the router functions."""
     missing_models: list[str] = []
     for router_name, functions in router_functions.items():
+        router_path = os.path.join(*router_name.split(".")) + ".py"
         for function in functions:
-            decorator = find_decorator(
-                os.path.join(*router_name.split(".")) + ".py",
-                function.__name__,
-            )
+            decorator = find_decorator(router_path, function.__name__)
             if (
                 decorator
                 and "model" in decorator
@@ -271,10 +286,12 @@ def find_missing_router_function_models(
     return missing_models
 
 
-def parse_example_string(example_string: str) -> dict[str, Any]:
-    """Parse a string of examples into nested dictionaries.
+@cache
+def parse_example_string(example_string: str) -> MappingProxyType[str, Any]:
+    """Parse a string of examples into nested read-only mappings.
 
     This is capturing all instances of PythonEx and APIEx, including their "parameters", "code", and "description".
+    The result is cached and shared between callers, so it is returned as read-only views and tuples.
     """
     # Initialize the result dictionary
     result = {}
@@ -288,9 +305,13 @@ def parse_example_string(example_string: str) -> dict[str, Any]:
         examples = []
         for match in matches:
             examples.append(
-                {"code": [match]} if example_type == "PythonEx" else {"params": match}
+                MappingProxyType(
+                    {"code": (match,)}
+                    if example_type == "PythonEx"
+                    else {"params": match}
+                )
             )
-        return examples
+        return tuple(examples)
 
     # Find and parse all PythonEx examples
     pythonex_matches = re.findall(pythonex_pattern, example_string, re.DOTALL)
@@ -300,16 +321,18 @@ def parse_example_string(example_string: str) -> dict[str, Any]:
     apiex_matches = re.findall(apiex_pattern, example_string, re.DOTALL)
     result["APIEx"] = parse_examples(apiex_matches, "APIEx")
 
-    return result
+    return MappingProxyType(result)
 
 
-def get_required_fields(model: str) -> list[str]:
+@cache
+def get_required_fields(model: str) -> tuple[str, ...]:
     """Get the required fields of a model."""
     fields = pi.map[model]["openbb"]["QueryParams"]["fields"]
-    return [field for field, info in fields.items() if info.is_required()]
+    return tuple(field for field, info in fields.items() if info.is_required())
 
 
-def get_all_fields(model: str) -> list[str]:
+@cache
+def get_all_fields(model: str) -> tuple[str, ...]:
     """Get all the fields of a model."""
     all_fields: list[str] = []
     info = pi.map[model]
@@ -318,4 +341,4 @@ def get_all_fields(model: str) -> list[str]:
         for field, _ in provider_info["QueryParams"]["fields"].items():
             all_fields.append(field)
 
-    return all_fields
+    return tuple(all_fields)
@@ -2,6 +2,7 @@
 
 import ast
 import os
+from functools import cache, lru_cache
 from typing import Any
 
 from openbb_core.app.provider_interface import ProviderInterface
@@ -18,14 +19,27 @@ from .helpers import (
     parse_example_string,
 )
 
+_EXPECTED_ARGS = ("cc", "provider_choices", "standard_params", "extra_params")
+
+
+@cache
+def _load_router_functions(target_dir: str = "extensions") -> dict:
+    """Collect, import and reflect the routers in the target directory once."""
+    routers = collect_routers(target_dir)
+    loaded_routers = import_routers(routers)
+    return collect_router_functions(loaded_routers)
+
+
+@cache
+def _provider_interface_map() -> dict:
+    """Get the provider interface map once."""
+    return ProviderInterface().map
+
 
 def check_router_function_models() -> list[str]:
     """Check if the models in the router functions exist in the provider interface map."""
-    pi = ProviderInterface()
-    pi_map = pi.map
-    routers = collect_routers("extensions")
-    loaded_routers = import_routers(routers)
-    router_functions = collect_router_functions(loaded_routers)
+    pi_map = _provider_interface_map()
+    router_functions = _load_router_functions("extensions")
     missing_models = find_missing_router_function_models(router_functions, pi_map)
 
     return missing_models
@@ -33,33 +47,28 @@ def check_router_function_models() -> list[str]:
 
 def check_router_model_functions_signature() -> list[str]:
     """Check if the router model functions have the correct signature."""
-    expected_args = ["cc", "provider_choices", "standard_params", "extra_params"]
     expected_return_type = "OBBject"
     missing_args: list[str] = []
     missing_return_type: list[str] = []
 
-    routers = collect_routers("extensions")
-    loaded_routers = import_routers(routers)
-    router_functions = collect_router_functions(loaded_routers)
+    router_functions = _load_router_functions("extensions")
 
     for router_name, functions in router_functions.items():
+        router_path = os.path.join(*router_name.split(".")) + ".py"
         for function in functions:
-            decorator = find_decorator(
-                os.path.join(*router_name.split(".")) + ".py",
-                function.__name__,
-            )
+            decorator = find_decorator(router_path, function.__name__)
             if decorator:
                 if "POST" in decorator or "GET" in decorator:
                     continue
-                args = list(function.__code__.co_varnames)
+                code = function.__code__
+                args = frozenset(
+                    code.co_varnames[: code.co_argcount + code.co_kwonlyargcount]
+                )
+                missing = [arg for arg in _EXPECTED_ARGS if arg not in args]
 
-                if (
-                    args
-                    and not all(arg in args for arg in expected_args)
-                    and "model" in decorator
-                ):
+                if args and missing and "model" in decorator:
                     missing_args.append(
-                        f"{function.__name__} in {router_name} missing expected args: {expected_args}"
+                        f"{function.__name__} in {router_name} missing expected args: {missing}"
                     )
                 if expected_return_type not in str(function.__annotations__["return"]):
                     missing_return_type.append(
@@ -70,6 +79,12 @@ def check_router_model_functions_signature() -> list[str]:
     return missing_args + missing_return_type
 
 
+@lru_cache(maxsize=4096)
+def _parse_params(params: str) -> dict:
+    """Parse the parameters of an API example."""
+    return ast.literal_eval(params or "{}")
+
+
 def check_general(
     keywords: dict, examples: list, router_name: str, function: Any
 ) -> list[str]:
@@ -93,13 +108,13 @@ def check_api(
     api_example_violation: list[str] = []
     parsed_examples = parse_example_string(examples)
     if model and "APIEx" in parsed_examples:
-        required_fields = set(get_required_fields(model.strip("'")))
-        all_fields = get_all_fields(model.strip("'"))
-        all_fields.append("provider")
+        model = model.strip("'")
+        required_fields = set(get_required_fields(model))
+        all_fields = frozenset(get_all_fields(model)) | {"provider"}
         required_fields_met = False
 
         for api_example in parsed_examples["APIEx"]:
-            params = ast.literal_eval(api_example.get("params", "{}"))
+            params = _parse_params(api_example.get("params", "{}"))
             if not required_fields_met and required_fields.issubset(params.keys()):
                 required_fields_met = True
 
@@ -125,21 +140,17 @@ def check_router_command_examples() -> list[str]:
     api_example_violation: list[str] = []
     python_example_violation: list[str] = []
 
-    routers = collect_routers("extensions")
-    loaded_routers = import_routers(routers)
-    router_functions = collect_router_functions(loaded_routers)
+    router_functions = _load_router_functions("extensions")
 
     for router_name, functions in router_functions.items():
+        router_path = os.path.join(*router_name.split(".")) + ".py"
         for function in functions:
             if (
                 "basemodel_to_df" in function.__name__
                 or "router" not in function.__module__
             ):
                 continue
-            decorator = find_decorator(
-                os.path.join(*router_name.split(".")) + ".py",
-                function.__name__,
-            )
+            decorator = find_decorator(router_path, function.__name__)
             if decorator:
                 decorator_details = get_decorator_details(function)
                 if decorator_details and decorator_details.name == "router.command":
@@ -20,8 +20,15 @@ def headers():
     return {"Authorization": f"Basic {base64_bytes.decode('ascii')}"}
 
 
+@pytest.fixture(scope="session")
+def http():
+    """Get a session that reuses connections to the API across tests."""
+    with requests.Session() as session:
+        yield session
+
+
 @pytest.mark.integration
-def test_federal_reserve_fomc_documents_download(headers):
+def test_federal_reserve_fomc_documents_download(headers, http):
     """Test the federal reserve fomc documents download endpoint."""
     params = {
         "url": [
@@ -30,7 +37,7 @@ def test_federal_reserve_fomc_documents_download(headers):
     }
 
     url = "http://localhost:8000/api/v1/federal_reserve/fomc_documents_download"
-    result = requests.post(url, headers=headers, timeout=10, json=params)
+    result = http.post(url, headers=headers, timeout=10, json=params)
     assert isinstance(result, requests.Response)
     assert result.status_code == 200
 
@@ -45,12 +52,12 @@ def test_federal_reserve_fomc_documents_download(headers):
     ],
 )
 @pytest.mark.integration
-def test_federal_reserve_fomc_documents_choices(headers, params):
+def test_federal_reserve_fomc_documents_choices(headers, http, params):
     """Test the federal reserve fomc documents choices endpoint."""
     url = (
         "http://localhost:8000/api/v1/federal_reserve/fomc_documents_choices?"
         + get_querystring(params, [])
     )
-    result = requests.get(url, headers=headers, timeout=10)
+    result = http.get(url, headers=headers, timeout=10)
     assert isinstance(result, requests.Response)
     assert result.status_code == 200
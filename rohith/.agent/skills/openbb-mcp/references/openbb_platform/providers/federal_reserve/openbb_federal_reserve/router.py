@@ -1,24 +1,36 @@
 """OpenBB Federal Reserve Router Module."""
 
+from collections.abc import Iterable
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import APIRouter, Body
+from fastapi.responses import JSONResponse, Response
 from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.provider.utils.lru import ttl_cache
 
 router = APIRouter()
 
+_ALLOWED_HOSTS = frozenset({"www.federalreserve.gov", "federalreserve.gov"})
+_OK_SUFFIXES = (".pdf", ".htm", ".html")
+
 
 @router.get("/apps.json", include_in_schema=False)
-async def get_apps_json():
+async def get_apps_json() -> Response:
     """Get the apps.json for the Federal Reserve provider."""
+    return Response(content=_apps_json_body(), media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def _apps_json_body() -> bytes:
+    """Load and render the packaged apps.json once."""
     # pylint: disable=import-outside-toplevel
     import json
     from pathlib import Path
 
     apps_json_path = Path(__file__).parent / "assets" / "apps.json"
     with open(apps_json_path, encoding="utf-8") as file:
-        apps_data = json.load(file)
-    return apps_data
+        return JSONResponse(content=json.load(file)).body
 
 
 @router.post(
@@ -42,100 +54,109 @@ async def fomc_documents_download(params: Annotated[dict, Body()]) -> list:
         A list of dictionaries, each containing keys `filename`, `content`, and `data_format`.
     """
     # pylint: disable=import-outside-toplevel
-    import base64  # noqa
-    from io import BytesIO
+    import asyncio
     from urllib.parse import urlparse
+
     from openbb_core.provider.utils.helpers import make_request
 
     urls = params.get("url", [])
-    results: list = []
 
     for url in urls:
         parsed_url = urlparse(url)
         hostname = parsed_url.hostname or ""
 
-        if parsed_url.scheme != "https" or hostname not in {
-            "www.federalreserve.gov",
-            "federalreserve.gov",
-        }:
+        if parsed_url.scheme != "https" or hostname not in _ALLOWED_HOSTS:
             raise OpenBBError(
                 "Invalid URL provided for download. Must be from federalreserve.gov -> "
                 + url
             )
 
-        is_pdf = url.lower().endswith(".pdf")
-
-        if (
-            not is_pdf
-            and not url.lower().endswith(".htm")
-            and not url.lower().endswith(".html")
-        ):
+        if not url.lower().endswith(_OK_SUFFIXES):
             raise OpenBBError(
                 "Unsupported document format. File must be PDF or HTM type -> " + url
             )
 
+    def download(url: str) -> dict:
+        """Download a single document."""
+        is_pdf = url.lower().endswith(".pdf")
+        filename = url.rsplit("/", 1)[-1]
+
         try:
-            response = make_request(url)
-            response.raise_for_status()
-            pdf = (
-                base64.b64encode(BytesIO(response.content).getvalue()).decode("utf-8")
-                if isinstance(response.content, bytes)
-                else response.content
-            )
-            results.append(
-                {
-                    "content": pdf,
-                    "data_format": {
-                        "data_type": "pdf" if is_pdf else "markdown",
-                        "filename": url.split("/")[-1],
-                    },
-                }
-            )
+            with make_request(url, stream=True) as response:
+                response.raise_for_status()
+                content = _b64encode_chunks(response.iter_content(64 * 1024))
+            return {
+                "content": content,
+                "data_format": {
+                    "data_type": "pdf" if is_pdf else "markdown",
+                    "filename": filename,
+                },
+            }
         except Exception as exc:
-            results.append(
-                {
-                    "error_type": "download_error",
-                    "content": f"{exc.__class__.__name__}: {exc.args[0]}",
-                    "filename": url.split("/")[-1],
-                }
-            )
-            continue
+            return {
+                "error_type": "download_error",
+                "content": f"{exc.__class__.__name__}: {exc.args[0]}",
+                "filename": filename,
+            }
+
+    return list(
+        await asyncio.gather(*(asyncio.to_thread(download, url) for url in urls))
+    )
 
-    return results
+
+def _b64encode_chunks(chunks: Iterable[bytes]) -> str:
+    """Base64 encode a stream of bytes without holding the whole body in memory."""
+    # pylint: disable=import-outside-toplevel
+    import base64
+
+    encoded = bytearray()
+    tail = b""
+    for chunk in chunks:
+        data = tail + chunk
+        # Only whole 3-byte groups can be encoded without padding
+        cut = len(data) - len(data) % 3
+        encoded += base64.b64encode(data[:cut])
+        tail = data[cut:]
+    encoded += base64.b64encode(tail)
+
+    return encoded.decode("ascii")
 
 
 @router.get("/fomc_documents_choices", include_in_schema=False)
 async def fomc_documents_choices(
     year: int | None = None, document_type: str | None = None
-) -> list:
+) -> Response:
     """Get the available choices for FOMC document types.
 
     Returns
     -------
-    list
-        A list of available document choices with URLs for download.
+    Response
+        A JSON list of available document choices with URLs for download.
     """
+    return Response(
+        content=_fomc_documents_choices_body(year, document_type),
+        media_type="application/json",
+    )
+
+
+@ttl_cache(maxsize=32, ttl=3600)
+def _fomc_documents_choices_body(year: int | None, document_type: str | None) -> bytes:
+    """Build and render the FOMC document choices for a year and document type."""
     # pylint: disable=import-outside-toplevel
     from openbb_federal_reserve.utils.fomc_documents import (
         get_fomc_documents_by_year,
     )
 
     docs = get_fomc_documents_by_year(year, document_type, True)
-    choices_list: list = []
-
-    for doc in docs:
-        title = (
-            doc.get("doc_type", "").replace("_", " ").title()
+    choices_list = [
+        {
+            "label": doc.get("doc_type", "").replace("_", " ").title()
             + " - "
-            + doc.get("date", "")
-        )
-        value = doc.get("url", "")
-        if title and value:
-            choices_list.append(
-                {
-                    "label": title,
-                    "value": value,
-                }
-            )
-
-    return choices_list
+            + doc.get("date", ""),
+            "value": doc["url"],
+        }
+        for doc in docs
+        if doc.get("url")
+    ]
+
+    return JSONResponse(content=choices_list).body
@@ -1,5 +1,8 @@
 """PSD Data Downloader Utils"""
 
+from asyncio import gather, to_thread
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Literal
 
 from openbb_government_us.utils.psd_codes import (
@@ -14,6 +17,22 @@ from openbb_government_us.utils.psd_codes import (
 
 REPORT_HANDLER_URL = "https://apps.fas.usda.gov/psdonline/reportHandler.ashx"
 
+# Country code -> first country key that uses it (e.g. "E4" -> "eu")
+_CODE_TO_KEY = {code: key for key, code in reversed(COUNTRIES.items())}
+# Region display name -> region code (e.g. "North America" -> "R01")
+_REGION_NAMES = {name: code for code, name in REGION_DISPLAY.items()}
+_REGION_CODES = list(REGIONS.values())
+_REGION_CODE_SET = frozenset(_REGION_CODES)
+
+_FILENAME_TABLE = str.maketrans({" ": "_", ":": None, ",": None, "/": "_"})
+
+# Report ID -> (title, template ID), across all commodity groups.
+_REPORT_INDEX: dict[int, tuple[str, int]] = {
+    report_id: (report["title"], report["templateId"])
+    for group_data in PSD_REPORTS_METADATA.values()
+    for report_id, report in group_data["reports"].items()
+}
+
 
 def get_report_url(
     report_id: int,
@@ -40,31 +59,22 @@ def get_report_url(
     >>> print(url)
     'https://apps.fas.usda.gov/psdonline/reportHandler.ashx?reportId=2109&templateId=8&format=csv&fileName=Coffee_Summary'
     """
-    # Find the report in metadata
-    for group_data in PSD_REPORTS_METADATA.values():
-        if report_id in group_data["reports"]:
-            report = group_data["reports"][report_id]
-            title = report["title"]
-            template_id = report["templateId"]
-
-            # Create a clean filename from the title
-            filename = (
-                title.replace(" ", "_")
-                .replace(":", "")
-                .replace(",", "")
-                .replace("/", "_")
-            )
+    if report_id not in _REPORT_INDEX:
+        raise ValueError(
+            f"Report ID {report_id} not found. Use list_reports() to see available reports."
+        )
 
-            return (
-                f"{REPORT_HANDLER_URL}?"
-                f"reportId={report_id}&"
-                f"templateId={template_id}&"
-                f"format={file_format}&"
-                f"fileName={filename}"
-            )
+    title, template_id = _REPORT_INDEX[report_id]
+
+    # Create a clean filename from the title
+    filename = title.translate(_FILENAME_TABLE)
 
-    raise ValueError(
-        f"Report ID {report_id} not found. Use list_reports() to see available reports."
+    return (
+        f"{REPORT_HANDLER_URL}?"
+        f"reportId={report_id}&"
+        f"templateId={template_id}&"
+        f"format={file_format}&"
+        f"fileName={filename}"
     )
 
 
@@ -110,65 +120,100 @@ async def get_psd_report_data(report_id: int) -> dict:
     from openbb_core.provider.utils.helpers import get_async_requests_session
     from openbb_government_us.utils.psd_template_parser import parse_report
 
-    # Get template ID for this report
-    template_id = None
-    for group_data in PSD_REPORTS_METADATA.values():
-        if report_id in group_data["reports"]:
-            template_id = group_data["reports"][report_id]["templateId"]
-            break
-
-    if template_id is None:
+    if report_id not in _REPORT_INDEX:
         raise OpenBBError(f"Invalid report ID -> {report_id} was not found.")
 
+    template_id = _REPORT_INDEX[report_id][1]
+
     # Build URLs for both formats
     html_url = get_report_url(report_id, "html")
     csv_url = get_report_url(report_id, "csv")
-    session = await get_async_requests_session()
 
     try:
-        # Fetch both HTML (for units) and CSV (for data)
-        html_resp = await session.get(html_url)
-        html = await html_resp.text()
-        csv_resp = await session.get(csv_url)
-        csv_text = await csv_resp.text()
+        async with await get_async_requests_session() as session:
+            # Fetch both HTML (for units) and CSV (for data) concurrently
+            responses = await gather(
+                session.get(html_url), session.get(csv_url), return_exceptions=True
+            )
+            errors = [r for r in responses if isinstance(r, BaseException)]
+            if errors:
+                # Close whichever response did arrive before the session goes away
+                for resp in responses:
+                    if not isinstance(resp, BaseException):
+                        resp.close()
+                raise errors[0]
+            html_resp, csv_resp = responses
+            html, csv_text = await gather(html_resp.text(), csv_resp.text())
     except ClientError as e:
         raise OpenBBError(f"Error fetching report {report_id} -> {e}") from e
-    finally:
-        await session.close()
 
     # Check for server error
     if "error" in csv_text.lower():
         raise OpenBBError(f"Server error fetching report {report_id} -> {csv_text}")
 
-    lines = csv_text.replace("\r", "").strip().split("\n")
+    lines = csv_text.strip().splitlines()
 
     return parse_report(template_id, lines, html)
 
 
-def _get_commodity_attributes(commodity_code: str) -> list[str]:
-    """Fetch valid attribute names for a commodity using the metadata API."""
+@lru_cache(maxsize=256)
+def _fetch_commodity_attributes(commodity_code: str) -> tuple[str, ...]:
+    """Fetch and cache the attribute names for a commodity from the metadata API."""
     # pylint: disable=import-outside-toplevel
     from openbb_core.provider.utils.helpers import make_request
 
+    resp = make_request(
+        f"https://apps.fas.usda.gov/PSDOnlineApi/api/query/GetMultiCommodityAttributes?commodityCodes={commodity_code},"
+    )
+    if resp.status_code != 200:
+        raise ValueError(f"Metadata request failed -> {resp.status_code}")
+
+    id_to_key = {v: k for k, v in ATTRIBUTES.items()}
+    valid_keys = set()
+
+    for item in resp.json():
+        attr_id = item.get("attributeId")
+        if attr_id and attr_id in id_to_key:
+            valid_keys.add(id_to_key[attr_id])
+    if not valid_keys:
+        raise ValueError(f"No attributes found for commodity -> {commodity_code}")
+
+    return tuple(sorted(valid_keys))
+
+
+def _get_commodity_attributes(commodity_code: str) -> list[str]:
+    """Fetch valid attribute names for a commodity using the metadata API."""
     try:
-        resp = make_request(
-            f"https://apps.fas.usda.gov/PSDOnlineApi/api/query/GetMultiCommodityAttributes?commodityCodes={commodity_code},"
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            id_to_key = {v: k for k, v in ATTRIBUTES.items()}
-            valid_keys = set()
-
-            for item in data:
-                attr_id = item.get("attributeId")
-                if attr_id and attr_id in id_to_key:
-                    valid_keys.add(id_to_key[attr_id])
-            if valid_keys:
-                return sorted(list(valid_keys))
+        return list(_fetch_commodity_attributes(commodity_code))
     except Exception:  # noqa  # pylint: disable=broad-except
-        pass
-    # Fallback: return all attributes
-    return list(ATTRIBUTES.keys())
+        # Fallback: return all attributes
+        return list(ATTRIBUTES.keys())
+
+
+@lru_cache(maxsize=256)
+def _fetch_commodity_countries(commodity_code: str) -> MappingProxyType[str, str]:
+    """Fetch and cache the country names and codes for a commodity from the metadata API."""
+    # pylint: disable=import-outside-toplevel
+    from openbb_core.provider.utils.helpers import make_request
+
+    base_url = "https://apps.fas.usda.gov/PSDOnlineApi/api/CompositeVisualization/GetCountries?regionCode=R00&commodityCode="
+
+    resp = make_request(
+        f"{base_url}{commodity_code}",
+    )
+    if resp.status_code != 200:
+        raise ValueError(f"Metadata request failed -> {resp.status_code}")
+
+    name_to_code = {}
+    for item in resp.json():
+        code = item.get("value")
+        name = item.get("text", "").strip()
+        if code and name and code != "00":  # Skip "All Countries" (00)
+            name_to_code[name] = code
+    if not name_to_code:
+        raise ValueError(f"No countries found for commodity -> {commodity_code}")
+
+    return MappingProxyType(name_to_code)
 
 
 def _get_commodity_countries(commodity_code: str) -> dict[str, str]:
@@ -184,29 +229,27 @@ def _get_commodity_countries(commodity_code: str) -> dict[str, str]:
     dict[str, str]
         Mapping of country name -> country code
     """
-    # pylint: disable=import-outside-toplevel
-    from openbb_core.provider.utils.helpers import make_request
-
-    base_url = "https://apps.fas.usda.gov/PSDOnlineApi/api/CompositeVisualization/GetCountries?regionCode=R00&commodityCode="
-
     try:
-        resp = make_request(
-            f"{base_url}{commodity_code}",
-        )
-        if resp.status_code == 200:
-            data = resp.json()
-            name_to_code = {}
-            for item in data:
-                code = item.get("value")
-                name = item.get("text", "").strip()
-                if code and name and code != "00":  # Skip "All Countries" (00)
-                    name_to_code[name] = code
-            if name_to_code:
-                return name_to_code
+        return dict(_fetch_commodity_countries(commodity_code))
     except Exception:  # noqa  # pylint: disable=broad-except
-        pass
-    # Fallback: return empty (will use global COUNTRIES list)
-    return {}
+        # Fallback: return empty (will use global COUNTRIES list)
+        return {}
+
+
+async def _get_commodity_metadata(
+    commodity_code: str,
+) -> tuple[list[str], dict[str, str]]:
+    """Fetch the valid attributes and countries for a commodity concurrently."""
+    return await gather(
+        to_thread(_get_commodity_attributes, commodity_code),
+        to_thread(_get_commodity_countries, commodity_code),
+    )
+
+
+def clear_psd_metadata_caches() -> None:
+    """Clear the cached commodity attribute and country metadata."""
+    _fetch_commodity_attributes.cache_clear()
+    _fetch_commodity_countries.cache_clear()
 
 
 def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
@@ -268,7 +311,7 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
     from aiohttp import ClientError, ClientSession
     from openbb_core.app.model.abstract.error import OpenBBError
     from openbb_core.provider.utils.helpers import get_async_requests_session, run_async
-    from pandas import DataFrame, notna
+    from pandas import DataFrame, MultiIndex
 
     QUERY_URL = "https://apps.fas.usda.gov/PSDOnlineApi/api/query/RunQuery"
     key = commodity.lower().replace(" ", "_").replace("-", "_")
@@ -279,7 +322,10 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
         )
 
     commodity_code = COMMODITIES[key]
-    valid_attrs = _get_commodity_attributes(commodity_code)
+    # Both metadata lookups are independent, so overlap their round trips
+    valid_attrs, valid_countries_map = run_async(
+        _get_commodity_metadata, commodity_code
+    )
     # Resolve attribute - None means ALL, can be single, list, or comma-separated
     if attribute is None:
         attr_ids = [ATTRIBUTES[a] for a in valid_attrs]
@@ -308,22 +354,20 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
     # Accepts: lower_snake_case ("united_states"), codes ("US", "R05"), list, comma-separated, or None for all
     selected_region_codes: list[str] = []  # Track selected regions
     selected_country_codes: list[str] = []  # Track selected countries
-    valid_countries_map = _get_commodity_countries(commodity_code)
     valid_country_codes = set(valid_countries_map.values())
-    code_to_key = {}
-
-    for key, code in COUNTRIES.items():
-        if code not in code_to_key:
-            code_to_key[code] = key
 
     def get_valid_country_keys() -> list[str]:
         """Get sorted list of valid country keys from our COUNTRIES dict."""
         return sorted(
-            [code_to_key.get(c, c) for c in valid_country_codes if c in code_to_key]
+            [_CODE_TO_KEY[c] for c in valid_country_codes if c in _CODE_TO_KEY]
         )
 
     if country is None:
-        country_codes = list(valid_country_codes) if valid_country_codes else ["ALL"]
+        country_codes = (
+            list(dict.fromkeys(valid_countries_map.values()))
+            if valid_country_codes
+            else ["ALL"]
+        )
     else:
         country_list = (
             [c.strip() for c in country.split(",") if c.strip()]
@@ -392,31 +436,31 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
         if "R00" in selected_region_codes:
             # "world" selected - fetch all regional aggregates + any specific countries
             country_codes = (
-                list(REGIONS.values()) + selected_country_codes
+                _REGION_CODES + selected_country_codes
             )  # R00, R01, ... R18 + specific countries
-            country_codes = list(set(country_codes))  # Dedupe
+            country_codes = list(dict.fromkeys(country_codes))  # Dedupe
         elif selected_region_codes:
             # Specific regions selected - add World + those regions + any countries
             country_codes = ["R00"] + selected_region_codes + selected_country_codes
-            country_codes = list(set(country_codes))  # Dedupe
+            country_codes = list(dict.fromkeys(country_codes))  # Dedupe
         elif selected_country_codes:
             # Only countries selected - add World + their regions
-            regions_for_countries = set()
-            for cc in selected_country_codes:
-                if cc in COUNTRY_TO_REGION:
-                    regions_for_countries.add(COUNTRY_TO_REGION[cc])
-            country_codes = (
-                ["R00"] + list(regions_for_countries) + selected_country_codes
-            )
-            country_codes = list(set(country_codes))  # Dedupe
+            regions_for_countries = [
+                COUNTRY_TO_REGION[cc]
+                for cc in selected_country_codes
+                if cc in COUNTRY_TO_REGION
+            ]
+            country_codes = ["R00"] + regions_for_countries + selected_country_codes
+            country_codes = list(dict.fromkeys(country_codes))  # Dedupe
         elif country is None:
-            region_codes = set(REGIONS.values())
             # Exclude E4 (EU as country) since we're requesting R05 (EU as region)
             country_only_codes = [
-                c for c in valid_country_codes if c not in region_codes and c != "E4"
+                c
+                for c in dict.fromkeys(valid_countries_map.values())
+                if c not in _REGION_CODE_SET and c != "E4"
             ]
-            country_codes = list(REGIONS.values()) + country_only_codes
-            country_codes = list(set(country_codes))
+            country_codes = _REGION_CODES + country_only_codes
+            country_codes = list(dict.fromkeys(country_codes))
 
     # Determine year range
     current_year = datetime.now().year
@@ -424,11 +468,15 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
 
     # Split attrs into batches for parallel fetching (20 attrs per request is optimal)
     BATCH_SIZE = 20
+    # Cap the in-flight POSTs to the single USDA host for attribute-heavy queries
+    MAX_CONCURRENT_BATCHES = 10
     attr_batches = [
         attr_ids[i : i + BATCH_SIZE] for i in range(0, len(attr_ids), BATCH_SIZE)
     ]
 
-    async def fetch_batch(session: ClientSession, batch_attrs: list) -> list:
+    async def fetch_batch(
+        session: ClientSession, semaphore: asyncio.Semaphore, batch_attrs: list
+    ) -> list:
         """Fetch one batch of attributes."""
         payload = {
             "queryId": 0,
@@ -456,7 +504,7 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
             "topCountryState": False,
         }
         try:
-            async with await session.post(QUERY_URL, json=payload) as resp:
+            async with semaphore, await session.post(QUERY_URL, json=payload) as resp:
                 if resp.status != 200:
                     return []
                 data = await resp.json()
@@ -469,7 +517,8 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
     async def fetch_all_batches():
         """Fetch all batches concurrently."""
         async with await get_async_requests_session() as session:
-            tasks = [fetch_batch(session, batch) for batch in attr_batches]
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
+            tasks = [fetch_batch(session, semaphore, batch) for batch in attr_batches]
             results = await asyncio.gather(*tasks)
             # Flatten results
             all_results = []
@@ -496,15 +545,11 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
     year_cols = [c for c in df.columns if "/" in c and c[0:4].isdigit()]
     name_to_code = {name.strip(): code for name, code in valid_countries_map.items()}
     # Also add region display names for lookup
-    for region_code, region_name in REGION_DISPLAY.items():
-        name_to_code[region_name] = region_code
-
-    # Build region name lookup (for detecting when "country" is actually a region)
-    region_names = {v: k for k, v in REGION_DISPLAY.items()}  # "North America" -> "R01"
+    name_to_code.update(_REGION_NAMES)
 
     def get_region(country_name: str) -> str:
         """Check if this is actually a region (excluding EU)"""
-        if country_name in region_names and country_name != "European Union":
+        if country_name in _REGION_NAMES and country_name != "European Union":
             return country_name  # It's a region name, return as-is
         # European Union is treated as a country in the EU region
         if country_name == "European Union":
@@ -524,58 +569,52 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
         # "Other" is a region aggregate, not a country
         if country_name == "Other":
             return True
-        return country_name in region_names
-
-    # Melt to long format - include attribute per row from API response
-    rows = []
-    for _, row in df.iterrows():
-        country_name = row["country"]
-        # Skip rows with no country name
-        if not notna(country_name) or not country_name:
-            continue
-        commodity_display = row["commodity"] if row["commodity"] else commodity.title()
-        attr_display = row["attribute"] if row["attribute"] else ""
-        unit = row.get("unit Description", "") or ""
-        for yr_col in year_cols:
-            val = row[yr_col]
-            if notna(val):
-                # If country_name is actually a region, set region=name and country=""
-                if is_region(country_name):
-                    region_val = country_name
-                    country_val = "--"
-                else:
-                    region_val = get_region(country_name)
-                    country_val = country_name
-                rows.append(
-                    {
-                        "region": region_val,
-                        "country": country_val,
-                        "commodity": commodity_display,
-                        "attribute": attr_display,
-                        "marketing_year": yr_col,
-                        "value": val,
-                        "unit": unit.strip().strip("()"),
-                    }
-                )
+        return country_name in _REGION_NAMES
 
-    df_long = DataFrame(rows)
+    # Skip rows with no country name
+    df = df[df["country"].notna() & df["country"].astype(bool)].copy()
+    df["commodity"] = df["commodity"].where(
+        df["commodity"].astype(bool), commodity.title()
+    )
+    df["attribute"] = df["attribute"].where(df["attribute"].astype(bool), "")
+    if "unit Description" in df.columns:
+        unit = df["unit Description"]
+        df["unit"] = unit.where(unit.astype(bool), "").str.strip().str.strip("()")
+    else:
+        df["unit"] = ""
 
-    if df_long.empty:
+    if not df[year_cols].notna().to_numpy().any():
         raise OpenBBError(
             "No data available for the given parameters. -> "
             + f"{commodity} | {attribute} | {country} | {start_year}-{end_year}"
         )
 
     # Filter by year range (marketing_year is full format like "2024/2025")
-    if start_year is not None or end_year is not None:
-        df_long["_year"] = df_long["marketing_year"].str.split("/").str[0].astype(int)
+    year_cols = [
+        c
+        for c in year_cols
+        if (start_year is None or int(c.split("/")[0]) >= start_year)
+        and (end_year is None or int(c.split("/")[0]) <= end_year)
+    ]
 
-        if start_year is not None:
-            df_long = df_long[df_long["_year"] >= start_year]
-        if end_year is not None:
-            df_long = df_long[df_long["_year"] <= end_year]
+    # Melt to long format - include attribute per row from API response.
+    # Keep the original row index so rows can be put back in row-major order.
+    df_long = df.melt(
+        id_vars=["country", "commodity", "attribute", "unit"],
+        value_vars=year_cols,
+        var_name="marketing_year",
+        value_name="value",
+        ignore_index=False,
+    )
+    df_long = df_long[df_long["value"].notna()].sort_index(kind="stable")
 
-        df_long = df_long.drop(columns=["_year"])
+    # If the country name is actually a region, set region=name and country="--"
+    names = df_long["country"].unique()
+    regions = {name: name if is_region(name) else get_region(name) for name in names}
+    countries = {name: "--" if is_region(name) else name for name in names}
+    df_long["region"] = df_long["country"].map(regions)
+    df_long["country"] = df_long["country"].map(countries)
+    df_long = df_long.reset_index(drop=True)
 
     # Reorder columns
     df_long = df_long[
@@ -593,17 +632,14 @@ def get_timeseries(  # pylint: disable=R0912,R0914,R0915,R0917  # noqa: PLR0912
     # Hierarchical sorting: World first, then regions by value, then countries by value
     if not df_long[df_long["country"] == "--"].empty:
         # Get region totals for sorting regions by value (per attribute + year)
+        sort_keys = ["region", "attribute", "marketing_year"]
         region_totals = (
-            df_long[df_long["country"] == "--"]
-            .groupby(["region", "attribute", "marketing_year"])["value"]
-            .first()
-            .reset_index()
-        )
-        region_totals = region_totals.rename(columns={"value": "_region_value"})
-        # Merge region totals for sorting
-        df_long = df_long.merge(
-            region_totals, on=["region", "attribute", "marketing_year"], how="left"
+            df_long[df_long["country"] == "--"].groupby(sort_keys)["value"].first()
         )
+        # Look up each row's region total by key instead of merging frames
+        df_long["_region_value"] = region_totals.reindex(
+            MultiIndex.from_frame(df_long[sort_keys])
+        ).to_numpy()
         # World always sorts first
         df_long.loc[df_long["region"] == "World", "_region_value"] = float("inf")
 
@@ -7,8 +7,28 @@ Ensures all table formats are consistent long/tidy format:
 
 # pylint: disable=unused-argument,C0302
 
+import re
+
 from openbb_government_us.utils.psd_codes import REGION_DISPLAY
 
+_SUBTITLE_RE = re.compile(r"rptSubTitle[^>]*>([^<]+)")
+# Parenthesised units in header lines, e.g. "Area (Million hectares)"
+_PAREN_RE = re.compile(r"\(([^)]+)\)")
+# Period labels with trailing footnote digits, e.g. "2023/24444" or "Nov333"
+_PERIOD_RE = re.compile(r"^(\d{4}/\d{2})\d*$")
+_PREL_PERIOD_RE = re.compile(r"^(Prel\.\s*\d{4}/\d{2})\d*$")
+_PROJ_PERIOD_RE = re.compile(r"^(\d{4}/\d{2})(Proj\.?)\d*$")
+_MONTH_PERIOD_RE = re.compile(r"^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\d*$")
+# Region subtotal with its value in the same cell, e.g. "South America 12.3"
+_REGION_SUBTOTAL_RE = re.compile(r"^([A-Za-z ]+)\s+(\d+\.?\d*)$")
+
+_MONTHS = frozenset(
+    ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+)
+_MONTHS_LOWER = frozenset(m.lower() for m in _MONTHS)
+# Placeholders the reports use for missing values
+_NULL_VALUES = frozenset(("nr", "na", "-", "--"))
+
 # Build KNOWN_REGIONS from REGION_DISPLAY values plus special cases
 KNOWN_REGIONS = set(REGION_DISPLAY.values()) | {
     "World Ex-US",
@@ -166,11 +186,34 @@ KNOWN_COMMODITIES = [
     "Turkey",
 ]
 
+# Lowercase commodity patterns, longest first, paired with the name to report.
+# Plurals resolve to their singular form when that is also a known commodity.
+_COMMODITY_PATTERNS = tuple(
+    (c.lower(), c[:-1] if c.endswith("s") and c[:-1] in KNOWN_COMMODITIES else c)
+    for c in sorted(KNOWN_COMMODITIES, key=len, reverse=True)
+)
+
+# Dairy commodities checked in order against template 7 titles, lowercased once
+_DAIRY_COMMODITIES = tuple(
+    (dc.lower(), dc)
+    for dc in (
+        "Butter",
+        "Cheese",
+        "Milk",
+        "Skim Milk Powder",
+        "Whole Milk Powder",
+        "Whey",
+        "Nonfat Dry Milk",
+        "Fluid Milk",
+    )
+)
+
 
 def parse_value(val: str) -> float | None:
     """Parse a value to float, handling special cases."""
     val = val.strip()
-    if not val or val.lower() in ("nr", "na", "-", "--", ""):
+    # Every placeholder is at most two characters, so skip lowercasing longer cells
+    if not val or (len(val) <= 2 and val.lower() in _NULL_VALUES):
         return None
     try:
         return float(val.replace(",", ""))
@@ -184,12 +227,9 @@ def extract_unit_from_html(html_text: str) -> str | None:
     The subtitle format is often: "Commodity Group  Unit" (double-space separated)
     We want just the unit part.
     """
-    # pylint: disable=import-outside-toplevel
-    import re
-
     if not html_text:
         return None
-    match = re.search(r"rptSubTitle[^>]*>([^<]+)", html_text)
+    match = _SUBTITLE_RE.search(html_text)
     if not match:
         return None
 
@@ -224,11 +264,9 @@ def extract_commodity_from_title(
     """Extract commodity name from report title or fall back to commodity group."""
     title_lower = title.lower()
 
-    for c in sorted(KNOWN_COMMODITIES, key=len, reverse=True):
-        if c.lower() in title_lower:
-            if c.endswith("s") and c[:-1] in KNOWN_COMMODITIES:
-                return c[:-1]
-            return c
+    for pattern, name in _COMMODITY_PATTERNS:
+        if pattern in title_lower:
+            return name
     # Fall back to commodity group if provided
     if commodity_group:
         return COMMODITY_GROUP_MAP.get(commodity_group, commodity_group.title())
@@ -246,9 +284,6 @@ def parse_template_1(
     These are single-commodity tables. The commodity is in the title.
     Countries are rows, attributes (area/yield/production) are column groups.
     """
-    # pylint: disable=import-outside-toplevel
-    import re
-
     report_title = lines[0].strip()
     commodity = extract_commodity_from_title(report_title, commodity_group) or "Unknown"
 
@@ -258,7 +293,7 @@ def parse_template_1(
 
     # Extract units from header line
     header_line = lines[3] if len(lines) > 3 else ""
-    unit_matches = re.findall(r"\(([^)]+)\)", header_line)
+    unit_matches = _PAREN_RE.findall(header_line)
     units = {
         "area": unit_matches[0] if len(unit_matches) > 0 else "Unknown",
         "yield": unit_matches[1] if len(unit_matches) > 1 else "Unknown",
@@ -278,20 +313,7 @@ def parse_template_1(
             if "Proj" in proj_val:
                 current_proj = proj_val.replace(" Proj.", "")
 
-            if current_proj and _p in (
-                "Jan",
-                "Feb",
-                "Mar",
-                "Apr",
-                "May",
-                "Jun",
-                "Jul",
-                "Aug",
-                "Sep",
-                "Oct",
-                "Nov",
-                "Dec",
-            ):
+            if current_proj and _p in _MONTHS:
                 periods.append(f"{current_proj} {_p}")
             else:
                 periods.append(_p)
@@ -325,7 +347,9 @@ def parse_template_1(
             continue
 
         values = parts[1:]
-        has_data = any(parse_value(v) is not None for v in values)
+        # Parse each cell once; the column groups below index into this
+        parsed = [parse_value(v) for v in values]
+        has_data = any(v is not None for v in parsed)
 
         if not has_data:
             current_region = country
@@ -336,7 +360,7 @@ def parse_template_1(
 
         for i, period in enumerate(periods[:4]):
             # Area
-            val = parse_value(values[i]) if i < len(values) else None
+            val = parsed[i] if i < len(parsed) else None
             if val is not None:
                 data.append(
                     {
@@ -351,7 +375,7 @@ def parse_template_1(
                 )
 
             # Yield
-            val = parse_value(values[4 + i]) if 4 + i < len(values) else None
+            val = parsed[4 + i] if 4 + i < len(parsed) else None
             if val is not None:
                 data.append(
                     {
@@ -366,7 +390,7 @@ def parse_template_1(
                 )
 
             # Production
-            val = parse_value(values[8 + i]) if 8 + i < len(values) else None
+            val = parsed[8 + i] if 8 + i < len(parsed) else None
             if val is not None:
                 data.append(
                     {
@@ -382,7 +406,7 @@ def parse_template_1(
 
         # Change from last month/year (production change for latest projection period)
         latest_period = periods[-1] if periods else "Unknown"
-        if len(values) > 12 and parse_value(values[12]) is not None:
+        if len(parsed) > 12 and parsed[12] is not None:
             data.append(
                 {
                     "region": region_val,
@@ -390,11 +414,11 @@ def parse_template_1(
                     "commodity": commodity,
                     "attribute": "Production Change from Last Month",
                     "marketing_year": latest_period,
-                    "value": parse_value(values[12]),
+                    "value": parsed[12],
                     "unit": units["production"],
                 }
             )
-        if len(values) > 13 and parse_value(values[13]) is not None:
+        if len(parsed) > 13 and parsed[13] is not None:
             data.append(
                 {
                     "region": region_val,
@@ -402,11 +426,11 @@ def parse_template_1(
                     "commodity": commodity,
                     "attribute": "Production Change from Last Month (%)",
                     "marketing_year": latest_period,
-                    "value": parse_value(values[13]),
+                    "value": parsed[13],
                     "unit": "%",
                 }
             )
-        if len(values) > 14 and parse_value(values[14]) is not None:
+        if len(parsed) > 14 and parsed[14] is not None:
             data.append(
                 {
                     "region": region_val,
@@ -414,11 +438,11 @@ def parse_template_1(
                     "commodity": commodity,
                     "attribute": "Production Change from Last Year",
                     "marketing_year": latest_period,
-                    "value": parse_value(values[14]),
+                    "value": parsed[14],
                     "unit": units["production"],
                 }
             )
-        if len(values) > 15 and parse_value(values[15]) is not None:
+        if len(parsed) > 15 and parsed[15] is not None:
             data.append(
                 {
                     "region": region_val,
@@ -426,7 +450,7 @@ def parse_template_1(
                     "commodity": commodity,
                     "attribute": "Production Change from Last Year (%)",
                     "marketing_year": latest_period,
-                    "value": parse_value(values[15]),
+                    "value": parsed[15],
                     "unit": "%",
                 }
             )
@@ -581,18 +605,9 @@ def parse_template_7(
     # Extract commodity from title - e.g. "Butter Production and Consumption"
     # Try to find commodity name at the start of title
     commodity = None
-    dairy_commodities = [
-        "Butter",
-        "Cheese",
-        "Milk",
-        "Skim Milk Powder",
-        "Whole Milk Powder",
-        "Whey",
-        "Nonfat Dry Milk",
-        "Fluid Milk",
-    ]
-    for dc in dairy_commodities:
-        if dc.lower() in report_title.lower():
+    title_lower = report_title.lower()
+    for pattern, dc in _DAIRY_COMMODITIES:
+        if pattern in title_lower:
             commodity = dc
             break
 
@@ -680,12 +695,15 @@ def parse_template_8(
         first_col = parts[0].strip()
         values = parts[1:]
 
+        cells = [v.strip() for v in values]
+
         if first_col.lower() in ("nr", "") and all(
-            v.strip().lower() in ("nr", "") for v in values
+            c.lower() in ("nr", "") for c in cells
         ):
             continue
 
-        has_data = any(parse_value(v) is not None for v in values)
+        parsed = [parse_value(c) for c in cells]
+        has_data = any(v is not None for v in parsed)
 
         if first_col and not has_data:
             current_attribute = first_col
@@ -700,8 +718,8 @@ def parse_template_8(
         region_val, country_val = set_region_country(country, None)
 
         for i, period in enumerate(periods):
-            if i < len(values):
-                val = parse_value(values[i])
+            if i < len(parsed):
+                val = parsed[i]
                 if val is not None:
                     data.append(
                         {
@@ -768,7 +786,8 @@ def parse_template_13(
         first_col = parts[0].strip()
         values = parts[1:]
 
-        has_data = any(parse_value(v) is not None for v in values)
+        parsed = [parse_value(v) for v in values]
+        has_data = any(v is not None for v in parsed)
 
         # Section header = commodity (Wheat, Coarse Grains, etc.)
         if first_col and not has_data:
@@ -782,8 +801,8 @@ def parse_template_13(
         year = first_col
 
         for i, col in enumerate(columns):
-            if i < len(values):
-                val = parse_value(values[i])
+            if i < len(parsed):
+                val = parsed[i]
                 if val is not None:
                     data.append(
                         {
@@ -862,26 +881,7 @@ def parse_template_2(
     def looks_like_year(s: str) -> bool:
         """Heuristic to determine if a string looks like a year or projection indicator."""
         s = s.lower().strip()
-        return (
-            "/" in s
-            or "proj" in s
-            or "prel" in s
-            or s
-            in (
-                "nov",
-                "dec",
-                "jan",
-                "feb",
-                "mar",
-                "apr",
-                "may",
-                "jun",
-                "jul",
-                "aug",
-                "sep",
-                "oct",
-            )
-        )
+        return "/" in s or "proj" in s or "prel" in s or s in _MONTHS_LOWER
 
     for line in lines[6:]:
         if not line.strip():
@@ -891,7 +891,8 @@ def parse_template_2(
         first_col = parts[0].strip()
         values = parts[1:]
 
-        has_data = any(parse_value(v) is not None for v in values)
+        parsed = [parse_value(v) for v in values]
+        has_data = any(v is not None for v in parsed)
 
         if first_col and not has_data:
             if looks_like_year(first_col):
@@ -913,20 +914,7 @@ def parse_template_2(
                     first_col.replace("proj.", "").replace("Proj.", "").strip()
                 )
                 continue
-            if first_col.strip() in (
-                "Nov",
-                "Dec",
-                "Jan",
-                "Feb",
-                "Mar",
-                "Apr",
-                "May",
-                "Jun",
-                "Jul",
-                "Aug",
-                "Sep",
-                "Oct",
-            ):
+            if first_col.strip() in _MONTHS:
                 marketing_year = (
                     f"{current_proj_year} {first_col.strip()}"
                     if current_proj_year
@@ -939,8 +927,8 @@ def parse_template_2(
             continue
 
         for i, (region, country) in enumerate(columns):
-            if i < len(values):
-                val = parse_value(values[i])
+            if i < len(parsed):
+                val = parsed[i]
                 if val is not None:
                     data.append(
                         {
@@ -966,9 +954,6 @@ def parse_template_9(
     Multi-commodity table with country rows.
     Commodity is section header, Country is row, periods are columns.
     """
-    # pylint: disable=import-outside-toplevel
-    import re
-
     report_title = lines[0].strip()
     unit = extract_unit_from_html(html_text) or "Million metric tons"  # type: ignore
 
@@ -982,19 +967,19 @@ def parse_template_9(
         # Strip any trailing digits that don't belong
 
         # Handle "2023/24444" -> "2023/24"
-        m = re.match(r"^(\d{4}/\d{2})\d*$", p)
+        m = _PERIOD_RE.match(p)
         if m:
             return m.group(1)
         # Handle "Prel. 2024/25222" -> "Prel. 2024/25"
-        m = re.match(r"^(Prel\.\s*\d{4}/\d{2})\d*$", p)
+        m = _PREL_PERIOD_RE.match(p)
         if m:
             return m.group(1)
         # Handle "2025/26Proj.111" -> "2025/26 Proj."
-        m = re.match(r"^(\d{4}/\d{2})(Proj\.?)\d*$", p)
+        m = _PROJ_PERIOD_RE.match(p)
         if m:
             return f"{m.group(1)} {m.group(2)}"
         # Handle "Nov333" -> "Nov"
-        m = re.match(r"^(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\d*$", p)
+        m = _MONTH_PERIOD_RE.match(p)
         if m:
             return m.group(1)
         return p
@@ -1193,13 +1178,10 @@ def parse_template_20(
     - Regional subtotals (South America, South Asia, etc. with production value on same row)
     - Individual country rows under regions
     """
-    # pylint: disable=import-outside-toplevel
-    import re
-
     report_title = lines[0].strip()
     # Extract units from header line
     header_line = lines[3] if len(lines) > 3 else ""
-    unit_matches = re.findall(r"\(([^)]+)\)", header_line)
+    unit_matches = _PAREN_RE.findall(header_line)
     units = {
         "area": unit_matches[0] if len(unit_matches) > 0 else "Million hectares",
         "yield": (
@@ -1223,20 +1205,7 @@ def parse_template_20(
             if "Proj" in proj_val:
                 current_proj = proj_val.replace(" Proj.", "")
 
-            if current_proj and p in (
-                "Jan",
-                "Feb",
-                "Mar",
-                "Apr",
-                "May",
-                "Jun",
-                "Jul",
-                "Aug",
-                "Sep",
-                "Oct",
-                "Nov",
-                "Dec",
-            ):
+            if current_proj and p in _MONTHS:
                 periods.append(f"{current_proj} {_p}")
             else:
                 periods.append(_p)
@@ -1276,7 +1245,7 @@ def parse_template_20(
             continue
 
         # Check if this is a region subtotal line (region name + values on same line)
-        region_match = re.match(r"^([A-Za-z ]+)\s+(\d+\.?\d*)$", first_col)
+        region_match = _REGION_SUBTOTAL_RE.match(first_col)
 
         if not has_data:
             current_region = first_col
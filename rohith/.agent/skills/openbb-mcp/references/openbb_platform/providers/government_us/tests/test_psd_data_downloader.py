@@ -0,0 +1,127 @@
+"""Test PSD report session handling."""
+
+# pylint: disable=W0621,R0903
+import asyncio
+
+import pytest
+from aiohttp import ClientError
+from openbb_core.app.model.abstract.error import OpenBBError
+from openbb_core.provider.utils import helpers as core_helpers
+from openbb_government_us.utils import psd_data_downloader, psd_template_parser
+
+
+class FakeResponse:
+    """Minimal aiohttp response stand-in."""
+
+    def __init__(self, url: str):
+        """Store the requested URL."""
+        self.url = url
+        self.closed = False
+
+    def close(self) -> None:
+        """Mark the response as closed."""
+        self.closed = True
+
+    async def text(self) -> str:
+        """Return a report body for the requested format."""
+        return "<html></html>" if "format=html" in self.url else "Title\r\na,b\r\n"
+
+
+class FakeSession:
+    """Minimal aiohttp session stand-in that records whether it was closed."""
+
+    def __init__(self, fail: bool = False, fail_format: str | None = None):
+        """Initialize an open session, optionally failing all or one format's GETs."""
+        self.closed = False
+        self.fail = fail
+        self.fail_format = fail_format
+        self.responses: list[FakeResponse] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        """Enter the session context."""
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the session on context exit."""
+        await self.close()
+
+    async def get(self, url: str) -> FakeResponse:
+        """Return a fake response, or raise when configured to fail."""
+        if self.fail or (self.fail_format and f"format={self.fail_format}" in url):
+            raise ClientError("boom")
+        response = FakeResponse(url)
+        self.responses.append(response)
+        return response
+
+    async def close(self) -> None:
+        """Mark the session as closed."""
+        self.closed = True
+
+
+@pytest.fixture
+def sessions(monkeypatch):
+    """Record every session handed out to get_psd_report_data."""
+    created: list[FakeSession] = []
+
+    async def fake_get_async_requests_session(**kwargs):
+        session = FakeSession()
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(
+        core_helpers, "get_async_requests_session", fake_get_async_requests_session
+    )
+    monkeypatch.setattr(
+        psd_template_parser,
+        "parse_report",
+        lambda template_id, lines, html: {"template": template_id, "lines": lines},
+    )
+    return created
+
+
+def test_sequential_event_loops_leave_no_open_sessions(sessions):
+    """Test that each call closes its session, even across separate event loops."""
+    first = asyncio.run(psd_data_downloader.get_psd_report_data(2109))
+    second = asyncio.run(psd_data_downloader.get_psd_report_data(884))
+
+    assert first["lines"] == ["Title", "a,b"]
+    assert second["lines"] == ["Title", "a,b"]
+    assert len(sessions) == 2
+    assert all(session.closed for session in sessions)
+
+
+def test_session_closed_on_request_error(sessions, monkeypatch):
+    """Test that the session is closed when the download fails."""
+
+    async def failing_session(**kwargs):
+        session = FakeSession(fail=True)
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(core_helpers, "get_async_requests_session", failing_session)
+
+    with pytest.raises(OpenBBError, match="Error fetching report 2109"):
+        asyncio.run(psd_data_downloader.get_psd_report_data(2109))
+
+    assert len(sessions) == 1
+    assert sessions[0].closed
+
+
+def test_partial_failure_closes_the_successful_response(sessions, monkeypatch):
+    """Test that a failed CSV request still closes the HTML response and session."""
+
+    async def csv_failing_session(**kwargs):
+        session = FakeSession(fail_format="csv")
+        sessions.append(session)
+        return session
+
+    monkeypatch.setattr(core_helpers, "get_async_requests_session", csv_failing_session)
+
+    with pytest.raises(OpenBBError, match="Error fetching report 2109 -> boom"):
+        asyncio.run(psd_data_downloader.get_psd_report_data(2109))
+
+    session = sessions[0]
+    assert session.closed
+    assert len(session.responses) == 1
+    assert "format=html" in session.responses[0].url
+    assert session.responses[0].closed